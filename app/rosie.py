@@ -1,11 +1,49 @@
+from __future__ import annotations
 import datetime
-import boto3
-import pandas as pd
+import importlib
 from uuid import uuid4
+import os
 import sys
 import time
+import threading
 import json
-import pickle
+import io
+import hashlib
+from contextlib import contextmanager
+from urllib.parse import unquote_plus
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+class RosieLazyModule:
+    """
+    Módulo importado apenas no primeiro acesso a um de seus atributos, para que boto3,
+    pandas, numpy e pyarrow não pesem na inicialização de caminhos que não os usam.
+    O tempo gasto em cada import fica registrado em `RosieLazyModule.timings`.
+
+    Attributes:
+        name (str): Nome do módulo.
+    """
+    timings = {}
+
+    def __init__(self, name: str):
+        self.name = name
+        self.module = None
+
+    def load(self):
+        if self.module is None:
+            started = time.perf_counter()
+            module = importlib.import_module(self.name)
+            RosieLazyModule.timings.setdefault(self.name, time.perf_counter() - started)
+            self.module = module
+        return self.module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+boto3 = RosieLazyModule('boto3')
+pd = RosieLazyModule('pandas')
+np = RosieLazyModule('numpy')
+pa = RosieLazyModule('pyarrow')
+pq = RosieLazyModule('pyarrow.parquet')
 
 rosie_resources = [
             '',
@@ -16,24 +54,425 @@ rosie_resources = [
             'rosie-orquestrador',
             'ROSIE',
             'rosie-control_table',
-            'rosie-cleaner_monitoring'
+            'rosie-cleaner_monitoring',
+            'rosie-runtime'
             ]
 
+def load_control_table_schema() -> list:
+    """
+    Carrega as colunas da tabela de controle do mesmo JSON usado pela instalação para criar
+    a tabela (app/table/rosie-control_table.json). No job, o arquivo é baixado junto do
+    rosie.py; no repositório, é lido de app/table/.
+
+    return:
+        list: Colunas no formato {'Name', 'Type'}.
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    paths = [os.path.join(base_dir, 'rosie-control_table.json'), os.path.join(base_dir, 'table', 'rosie-control_table.json')]
+
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                return json.load(f)
+
+    raise FileNotFoundError(f"Schema da tabela de controle não encontrado em {paths}")
+
+control_table_schema = load_control_table_schema()
+
+class RosieTokenBucket:
+    """
+    Token bucket de uma operação da API: libera até `rate` chamadas por segundo, com
+    rajadas de até `capacity` chamadas. A taxa efetiva cai pela metade a cada throttling
+    e volta gradualmente à taxa configurada a cada chamada bem-sucedida.
+
+    Attributes:
+        rate (float): Chamadas por segundo configuradas. Deve ser maior que zero.
+        capacity (float): Tamanho máximo da rajada. Quando omitido, igual a `rate` (mínimo 1).
+    """
+    def __init__(self, rate: float, capacity: float = None):
+        if not float(rate) > 0:
+            raise ValueError(f"A taxa do token bucket deve ser maior que zero: {rate}")
+
+        self.max_rate = float(rate)
+        self.min_rate = self.max_rate / 20
+        self.rate = self.max_rate
+        self.capacity = capacity or max(self.max_rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if wait:
+            time.sleep(wait)
+
+    def throttled(self):
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def succeeded(self):
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+class RosieRateScheduler:
+    """
+    Agenda as chamadas à API da AWS com um token bucket por operação, usando os eventos
+    do botocore dos clientes criados pela `RosieClientFactory`. As taxas vêm de
+    `API_RATE_LIMITS` no RUNTIME do config, por operação (`glue.GetJobRuns`) ou por
+    serviço (`glue`), em chamadas por segundo. Operações sem taxa configurada, ou com taxa
+    inválida (não numérica ou menor ou igual a zero), não são limitadas.
+
+    Em um throttling apenas a taxa do token bucket é reduzida: a espera fica para o
+    `before-call` da próxima chamada, sem somar ao backoff de retry do próprio botocore.
+
+    Attributes:
+        rates (dict): Chamadas por segundo por operação ou serviço.
+    """
+    throttling_codes = [
+        'Throttling',
+        'ThrottlingException',
+        'ThrottledException',
+        'RequestThrottled',
+        'RequestThrottledException',
+        'TooManyRequestsException',
+        'RequestLimitExceeded',
+        'SlowDown',
+        'ProvisionedThroughputExceededException',
+    ]
+
+    def __init__(self, rates: dict = None):
+        self.rates = {}
+        for key, rate in (rates or {}).items():
+            try:
+                rate = float(rate)
+            except (TypeError, ValueError):
+                rate = None
+            if rate is None or not rate > 0:
+                print(f"Taxa inválida em API_RATE_LIMITS para '{key}' ({rates[key]}), a operação não será limitada")
+                continue
+            self.rates[key] = rate
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def get_bucket(self, operation_model):
+        service = operation_model.service_model.service_name
+        for key in [f'{service}.{operation_model.name}', service]:
+            if key in self.rates:
+                with self.lock:
+                    if key not in self.buckets:
+                        self.buckets[key] = RosieTokenBucket(self.rates[key])
+                    return self.buckets[key]
+        return None
+
+    def register(self, client):
+        if not self.rates:
+            return
+
+        client.meta.events.register('before-call', self.before_call)
+        client.meta.events.register('needs-retry', self.needs_retry)
+        client.meta.events.register('after-call', self.after_call)
+
+    def before_call(self, model, **kwargs):
+        bucket = self.get_bucket(model)
+        if bucket:
+            bucket.acquire()
+
+    def needs_retry(self, response, operation, **kwargs):
+        if response is None:
+            return None
+
+        code = response[1].get('Error', {}).get('Code')
+        if code in self.throttling_codes:
+            bucket = self.get_bucket(operation)
+            if bucket:
+                bucket.throttled()
+        return None
+
+    def after_call(self, http_response, model, **kwargs):
+        bucket = self.get_bucket(model)
+        if bucket and http_response.status_code < 300:
+            bucket.succeeded()
+
+class RosieMetrics:
+    """
+    Contabiliza as chamadas à API da AWS de uma execução da ROSIE pelos eventos do botocore
+    dos clientes criados pela `RosieClientFactory`: quantidade de chamadas, latência,
+    retries e throttling por operação (`glue.GetJobRuns`), além do tempo de cada fase
+    (list, enrich, classify, write) por serviço monitorado.
+
+    A latência é medida do envio da chamada até a resposta final, incluindo os retries e
+    excluindo a espera pelo `RosieRateScheduler`. As fases (`phase`) são tempos de relógio
+    de etapas sequenciais de um monitoramento e não se sobrepõem dentro do mesmo serviço.
+    Trechos executados dentro das threads de enriquecimento (`timer`, como a classificação)
+    são somados por thread e reportados à parte, pois se sobrepõem às fases.
+
+    Attributes:
+        enabled (bool): Quando falso, os clientes não são instrumentados.
+    """
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.started_at = datetime.datetime.now()
+        self.started = time.perf_counter()
+        self.calls = {}
+        self.phases = {}
+        self.timers = {}
+        self.lock = threading.Lock()
+
+    def register(self, client):
+        if not self.enabled:
+            return
+
+        client.meta.events.register('before-call', self.before_call)
+        client.meta.events.register('needs-retry', self.needs_retry)
+        client.meta.events.register('after-call', self.after_call)
+        client.meta.events.register('after-call-error', self.after_call_error)
+
+    def get_operation(self, key: str) -> dict:
+        if key not in self.calls:
+            self.calls[key] = {'latencies': [], 'retries': 0, 'throttles': 0}
+        return self.calls[key]
+
+    def before_call(self, model, context, **kwargs):
+        context['rosie_operation'] = f'{model.service_model.service_name}.{model.name}'
+        context['rosie_started'] = time.perf_counter()
+
+    def needs_retry(self, response, operation, **kwargs):
+        if response is None:
+            return None
+
+        code = response[1].get('Error', {}).get('Code')
+        if code in RosieRateScheduler.throttling_codes:
+            with self.lock:
+                self.get_operation(f'{operation.service_model.service_name}.{operation.name}')['throttles'] += 1
+        return None
+
+    def after_call(self, parsed, context, **kwargs):
+        self.record(context, parsed.get('ResponseMetadata', {}).get('RetryAttempts', 0))
+
+    def after_call_error(self, context, **kwargs):
+        self.record(context, 0)
+
+    def record(self, context: dict, retries: int):
+        if 'rosie_started' not in context:
+            return
+
+        elapsed = time.perf_counter() - context.pop('rosie_started')
+        with self.lock:
+            operation = self.get_operation(context['rosie_operation'])
+            operation['latencies'].append(elapsed)
+            operation['retries'] += retries
+
+    @contextmanager
+    def measure(self, totals: dict, service: str, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self.lock:
+                total = totals.setdefault((service, name), {'count': 0, 'seconds': 0.0})
+                total['count'] += 1
+                total['seconds'] += elapsed
+
+    def phase(self, service: str, name: str):
+        """
+        Mede o tempo de relógio de um bloco como a fase `name` do serviço `service`. Deve
+        envolver etapas sequenciais do monitoramento, fora das threads de enriquecimento.
+        """
+        return self.measure(self.phases, service, name)
+
+    def timer(self, service: str, name: str):
+        """
+        Soma o tempo de um bloco executado dentro das threads de enriquecimento. O total
+        é a soma do tempo de cada thread e se sobrepõe às fases.
+        """
+        return self.measure(self.timers, service, name)
+
+    def to_records(self, date_status: str) -> list:
+        """
+        Converte as métricas acumuladas em registros da tabela de controle: uma linha por
+        operação da API (`tipo_metrica` API), uma por fase (`tipo_metrica` FASE), uma por
+        tempo somado entre threads (`tipo_metrica` TEMPO_SOMADO, que não deve ser somado às
+        fases) e uma com o total da execução (`tipo_metrica` EXECUCAO). O início da execução
+        vai em `dt_inicio_execucao`, o que separa as execuções do mesmo dia.
+
+        Os registros usam apenas as colunas de métricas (`metrica`, `qtd_chamadas`,
+        `latencia_*`, ...); as colunas de recurso (`nome_recurso`, `servico`, `status`, ...)
+        ficam nulas, para que consultas que não filtram por `tipo` não as leiam como recursos.
+
+        Args:
+            date_status (str): Data da partição (YYYY-MM-DD).
+        return:
+            list: Registros com o schema da tabela de controle.
+        """
+        started_at = self.started_at.strftime('%Y-%m-%d %H:%M:%S')
+        records = []
+
+        with self.lock:
+            calls = {key: dict(operation, latencies=list(operation['latencies'])) for key, operation in self.calls.items()}
+            phases = {key: dict(phase) for key, phase in self.phases.items()}
+            timers = {key: dict(timer) for key, timer in self.timers.items()}
+
+        for key, operation in sorted(calls.items()):
+            latencies = np.array(operation['latencies'] or [0.0]) * 1000
+            records.append({
+                'metrica': key,
+                'tipo_metrica': 'API',
+                'dt_inicio_execucao': started_at,
+                'qtd_chamadas': len(operation['latencies']),
+                'qtd_retries': operation['retries'],
+                'qtd_throttles': operation['throttles'],
+                'latencia_p50_ms': np.percentile(latencies, 50),
+                'latencia_p90_ms': np.percentile(latencies, 90),
+                'latencia_p99_ms': np.percentile(latencies, 99),
+                'latencia_max_ms': latencies.max(),
+                'duracao_ms': latencies.sum(),
+                'dt_status': date_status,
+            })
+
+        for metric_type, totals in [('FASE', phases), ('TEMPO_SOMADO', timers)]:
+            for (service, name), total in sorted(totals.items()):
+                records.append({
+                    'metrica': f'{service}.{name}',
+                    'tipo_metrica': metric_type,
+                    'dt_inicio_execucao': started_at,
+                    'qtd_chamadas': total['count'],
+                    'duracao_ms': total['seconds'] * 1000,
+                    'dt_status': date_status,
+                })
+
+        records.append({
+            'metrica': 'ROSIE.total',
+            'tipo_metrica': 'EXECUCAO',
+            'dt_inicio_execucao': started_at,
+            'qtd_chamadas': sum(len(operation['latencies']) for operation in calls.values()),
+            'qtd_retries': sum(operation['retries'] for operation in calls.values()),
+            'qtd_throttles': sum(operation['throttles'] for operation in calls.values()),
+            'duracao_ms': (time.perf_counter() - self.started) * 1000,
+            'dt_status': date_status,
+        })
+
+        return records
+
+class RosieClientFactory:
+    """
+    Fábrica única de clientes AWS da ROSIE. Mantém um cliente por serviço e região,
+    com `max_pool_connections` dimensionado pela concorrência configurada e retries em
+    modo adaptativo, para que o throttling seja absorvido pelos retries.
+
+    Configurável em RUNTIME por `AWS_MAX_ATTEMPTS` (padrão 10), `AWS_RETRY_MODE`
+    (padrão `adaptive`) e `AWS_MAX_POOL_CONNECTIONS` (padrão: o maior entre `MAX_WORKERS`,
+    `S3_MAX_WORKERS_PER_BUCKET`, `CLEANER_MAX_WORKERS` e `CLEANER_COPY_WORKERS`). Todos os
+    clientes passam pelo `RosieRateScheduler` configurado por `API_RATE_LIMITS` e são
+    contabilizados pelo `RosieMetrics`, desligável por `API_METRICS`.
+
+    Attributes:
+        config (dict): Input do arquivo de configuração.
+        session (boto3.Session): Sessão usada na criação dos clientes. Quando omitida, uma nova é criada.
+    """
+    def __init__(self, config: dict = None, session: boto3.Session = None):
+        runtime = (config or {}).get('ROSIE_INFOS', {}).get('INSTALLATION', {}).get('RUNTIME', {})
+
+        self.session = session or boto3.Session()
+        self.region = (config or {}).get('ROSIE_INFOS', {}).get('INSTALLATION', {}).get('AWS_ACCOUNT', {}).get('AWS_REGION')
+        self.max_attempts = runtime.get('AWS_MAX_ATTEMPTS', 10)
+        self.retry_mode = runtime.get('AWS_RETRY_MODE', 'adaptive')
+        self.max_pool_connections = runtime.get('AWS_MAX_POOL_CONNECTIONS', max(
+            runtime.get('MAX_WORKERS', 10),
+            runtime.get('S3_MAX_WORKERS_PER_BUCKET', 0),
+            runtime.get('CLEANER_MAX_WORKERS', 10),
+            runtime.get('CLEANER_COPY_WORKERS', 16),
+            10
+        ))
+        self.scheduler = RosieRateScheduler(runtime.get('API_RATE_LIMITS', {}))
+        self.metrics = RosieMetrics(runtime.get('API_METRICS', True))
+        self.clients = {}
+        self.lock = threading.Lock()
+
+    def get_config(self, max_pool_connections: int = None):
+        from botocore.config import Config
+
+        return Config(
+            max_pool_connections=max_pool_connections or self.max_pool_connections,
+            retries={'total_max_attempts': self.max_attempts, 'mode': self.retry_mode}
+        )
+
+    def client(self, service: str, region: str = None, max_pool_connections: int = None):
+        """
+        Retorna o cliente do serviço e região, criando-o na primeira chamada.
+
+        Args:
+            service (str): Nome do serviço (ex: s3, glue).
+            region (str): Região do cliente. Quando omitida, usa a região do config ou da sessão.
+            max_pool_connections (int): Tamanho do pool de conexões, quando diferente do padrão.
+        return:
+            boto3.client: Cliente compartilhado.
+        """
+        region = region or self.region
+        key = (service, region, max_pool_connections)
+
+        with self.lock:
+            if key not in self.clients:
+                client = self.session.client(service, region_name=region, config=self.get_config(max_pool_connections))
+                self.scheduler.register(client)
+                self.metrics.register(client)
+                self.clients[key] = client
+            return self.clients[key]
+
 class RosieLifecycleManager:
     
     def __init__(self,
                  config: dict, 
                  date_status: str,
+                 client_factory: RosieClientFactory = None,
                  ):
         
         self.config = config
         self.date_status = date_status
+        self.client_factory = client_factory or RosieClientFactory(config)
         self.region = config['ROSIE_INFOS']['INSTALLATION']['AWS_ACCOUNT']['AWS_REGION']
         self.account_id = config['ROSIE_INFOS']['INSTALLATION']['AWS_ACCOUNT']['AWS_ACCOUNT_ID']
+        self.tags_cache = {}
+        self.prefetched_tags = set()
+        self.policies = {}
 
     def get_lifecycle(self, monitoring: str):
         return self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['MONITORING'][monitoring]['LIFECYCLE']
 
+    def build_policy(self, lifecycle: dict) -> dict:
+        details = lifecycle.get('DETAILS', {})
+        retention = {}
+        for value in details.get('ALLOWED_VALUES', []):
+            retention.setdefault(value['VALUE'].upper(), value)
+
+        return {
+            'lifecycle': lifecycle,
+            'type': lifecycle['TYPE_OF_MANAGEMENT'],
+            'values': list(retention.keys()),
+            'retention': retention,
+        }
+
+    def get_policy(self, monitoring: str) -> dict:
+        """
+        Retorna o ciclo de vida de um monitoramento compilado em tabelas de consulta
+        (valores permitidos em maiúsculo e retenção por classe), montado uma única vez.
+
+        Args:
+            monitoring (str): Nome do monitoramento (ex: GLUE_MONITORING).
+        return:
+            dict: `lifecycle`, `type`, `values` e `retention`.
+        """
+        if monitoring not in self.policies:
+            self.policies[monitoring] = self.build_policy(self.get_lifecycle(monitoring))
+
+        return self.policies[monitoring]
+
     def calculate_days(self, date_status: str, target_date: str):
         return (datetime.datetime.strptime(date_status, '%Y-%m-%d') - datetime.datetime.strptime(target_date, '%Y-%m-%d')).days
     
@@ -74,7 +513,8 @@ class RosieLifecycleManager:
             created_in: int = None,
             execution_in: int = None,
     ):
-        lifecycle = self.get_lifecycle(monitoring)
+        policy = self.get_policy(monitoring)
+        lifecycle = policy['lifecycle']
 
         if resource_name in rosie_resources:
             return 'ROSIE', 'ignore', 'IGNORE - Recurso de monitoramento da ROSIE.', None, 'ROSIE'
@@ -89,55 +529,271 @@ class RosieLifecycleManager:
             return self.handle_unique_management(lifecycle, created_in)
 
         if lifecycle['TYPE_OF_MANAGEMENT'] == 'RESOURCE_NAME':
-            return self.handle_resource_name_management(lifecycle, resource_name, created_in, execution_in)
+            return self.handle_resource_name_management(lifecycle, resource_name, created_in, execution_in, policy)
         
         if lifecycle['TYPE_OF_MANAGEMENT'] == 'TAG':
-            return self.handle_tag_management(lifecycle, monitoring, client, resource_name, created_in, execution_in)
+            return self.handle_tag_management(lifecycle, monitoring, client, resource_name, created_in, execution_in, policy)
 
         return 'N/A', 'unknown', 'TYPE_OF_MANAGEMENT não cadastrado', None, lifecycle['TYPE_OF_MANAGEMENT']
 
+    def verify_lifecycle_batch(self, monitoring: str, resources, apply_legacy: bool = True):
+        """
+        Versão vetorizada de `verify_lifecycle` + `verify_legacy` para um lote de recursos.
+
+        Args:
+            monitoring (str): Nome do monitoramento (ex: GLUE_MONITORING).
+            resources (pd.DataFrame | pyarrow.Table): Colunas `name`, `created_in`, `execution_in`
+                e, para ciclos de vida por TAG, `tags` (dict de tags de cada recurso).
+            apply_legacy (bool): Aplica as regras de legado sobre status e motivo.
+        return:
+            pd.DataFrame | pyarrow.Table: Colunas `class`, `status`, `reason`, `retention` e `type`,
+                no mesmo tipo e ordem da entrada.
+        """
+        is_arrow = not isinstance(resources, pd.DataFrame)
+        df = resources.to_pandas() if is_arrow else resources
+        index = df.index
+        df = df.reset_index(drop=True)
+
+        policy = self.get_policy(monitoring)
+        lifecycle = policy['lifecycle']
+        type_of_management = policy['type']
+        created_in = pd.to_numeric(df['created_in']).astype('Int64')
+        execution_in = pd.to_numeric(df['execution_in']).astype('Int64') if 'execution_in' in df else pd.Series(pd.NA, index=df.index, dtype='Int64')
+
+        def text(series: pd.Series) -> pd.Series:
+            return series.astype('Int64').astype(str)
+
+        def select(conditions: list, choices: list, default):
+            conditions = [condition.fillna(False).to_numpy(dtype=bool) if isinstance(condition, pd.Series) else condition for condition in conditions]
+            choices = [choice.to_numpy(dtype=object) if isinstance(choice, pd.Series) else choice for choice in choices]
+            default = default.to_numpy(dtype=object) if isinstance(default, pd.Series) else default
+            return pd.Series(np.select(conditions, choices, default=default), index=df.index, dtype=object)
+
+        if type_of_management == 'UNIQUE':
+            retention_days = lifecycle['RETENTION_DAYS']
+            coming = (created_in > (retention_days - lifecycle['DELETION_ALERT_COMING_DAYS'])) & (created_in <= retention_days)
+            expired = created_in > retention_days
+            result = pd.DataFrame({
+                'class': 'UNIQUE',
+                'status': select([coming, expired], ['deletion_coming', 'delete'], 'keep'),
+                'reason': select(
+                    [coming, expired],
+                    ['DELETE COMING - Tempo limite de retencao expirara em ' + text((retention_days - created_in).abs() + 1) + ' dia(s).', 'DELETE - Tempo limite de retencao expirou.'],
+                    'KEEP - Recursos dentro do tempo limite de retencao.'
+                ),
+                'retention': pd.Series(retention_days, index=df.index, dtype='Int64'),
+                'type': type_of_management,
+            }, index=df.index)
+
+        elif type_of_management in ['RESOURCE_NAME', 'TAG']:
+            values = policy['values']
+
+            if type_of_management == 'RESOURCE_NAME':
+                separator = lifecycle['DETAILS']['SEPARATOR']
+                affix = lifecycle['DETAILS']['AFFIX']
+                parts = df['name'].str.upper().str.split(separator, regex=False)
+                if affix == 'PREFIX':
+                    classification = parts.str[0]
+                elif affix == 'SUFFIX':
+                    classification = parts.str[-1]
+                elif affix == 'INFIX':
+                    inner = parts.str[1:-1].explode()
+                    classification = inner[inner.isin(values)].groupby(level=0).first().reindex(df.index)
+                else:
+                    classification = pd.Series(None, index=df.index, dtype=object)
+            else:
+                tag_name = lifecycle['DETAILS']['TAG_NAME']
+                classification = df['tags'].map(lambda tags: tags.get(tag_name) if isinstance(tags, dict) and tags.get(tag_name) else None).str.upper()
+
+            classification = classification.fillna('N/A')
+            valid = classification.isin(values)
+
+            def info(key: str) -> pd.Series:
+                return pd.to_numeric(classification.map({value: retention[key] for value, retention in policy['retention'].items()})).astype('Int64')
+
+            def flag(key: str) -> pd.Series:
+                return classification.map({value: bool(retention[key]) for value, retention in policy['retention'].items()}).fillna(False).astype(bool)
+
+            retention_flag = flag('RETENTION')
+            check_idle = flag('CHECK_IDLE')
+            retention_days = info('RETENTION_DAYS')
+            alert_days = info('DELETION_ALERT_COMING_DAYS')
+            idle_days = info('IDLE_DAYS')
+
+            retention_coming = valid & retention_flag & (created_in > (retention_days - alert_days)) & (created_in <= retention_days)
+            retention_expired = valid & retention_flag & (created_in > retention_days)
+            retention_keep = valid & retention_flag
+            idle_coming = valid & ~retention_flag & check_idle & (execution_in > (idle_days - alert_days)) & (execution_in <= idle_days)
+            idle_expired = valid & ~retention_flag & check_idle & (execution_in > idle_days)
+            idle_keep = valid & ~retention_flag & check_idle
+            active_keep = valid
+
+            irregular = lifecycle['DETAILS']['IRREGULAR_FORMAT']
+            if irregular['QUARANTINE']:
+                quarantine = ~valid & (created_in <= irregular['QUARANTINE_DAYS'])
+                irregular_retention = irregular['QUARANTINE_DAYS']
+            else:
+                quarantine = pd.Series(False, index=df.index)
+                irregular_retention = None
+
+            conditions = [retention_coming, retention_expired, retention_keep, idle_coming, idle_expired, idle_keep, active_keep, quarantine]
+            result = pd.DataFrame({
+                'class': classification.where(valid, 'N/A'),
+                'status': select(conditions, ['deletion_coming', 'delete', 'keep', 'deletion_coming', 'delete', 'keep', 'keep', 'quarantine'], 'delete'),
+                'reason': select(conditions, [
+                    'DELETE COMING - Tempo limite de retencao expirara em ' + text((retention_days - created_in).abs() + 1) + ' dia(s).',
+                    'DELETE - Tempo limite de retencao expirou.',
+                    'KEEP - Recursos dentro do tempo limite de retencao.',
+                    'DELETE COMING - Recurso ocioso por ' + text(execution_in) + ' dia(s), e sera deletado em ' + text((idle_days - execution_in).abs() + 1) + ' dia(s).',
+                    'DELETE - Recurso ocioso por ' + text(execution_in) + ' dia(s). Tempo limite de ' + text(idle_days) + ' dia(s) de ociosidade expirou.',
+                    'KEEP - Recurso ativo e sem ociosidade.',
+                    'KEEP - Recurso ativo. Não há verificação de ociosidade.',
+                    f'QUARANTINE - Recurso nao possui uma classificacao valida, e sera mantido por {irregular.get("QUARANTINE_DAYS")} dia(s) para que seja adequado.',
+                ], 'DELETE - Recurso deletado por nao possuir uma classificacao valida.'),
+                'retention': retention_days.where(retention_keep, pd.Series(irregular_retention, index=df.index, dtype='Int64').where(~valid)),
+                'type': type_of_management,
+            }, index=df.index)
+
+        else:
+            result = pd.DataFrame({
+                'class': 'N/A',
+                'status': 'unknown',
+                'reason': 'TYPE_OF_MANAGEMENT não cadastrado',
+                'retention': pd.Series(pd.NA, index=df.index, dtype='Int64'),
+                'type': type_of_management,
+            }, index=df.index)
+
+        rosie = df['name'].isin(rosie_resources)
+        result.loc[rosie, ['class', 'status', 'reason', 'type']] = ['ROSIE', 'ignore', 'IGNORE - Recurso de monitoramento da ROSIE.', 'ROSIE']
+        result.loc[rosie, 'retention'] = pd.NA
+
+        if apply_legacy:
+            result['status'], result['reason'] = self.verify_legacy_batch(result['status'], result['reason'])
+
+        result.index = index
+        if is_arrow:
+            return pa.Table.from_pandas(result, preserve_index=False)
+
+        return result
+
+    def verify_legacy_batch(self, status: pd.Series, reason: pd.Series):
+        if not self.config['ROSIE_INFOS']['INSTALLATION']['LEGACY']['ENABLED']:
+            return status, reason
+
+        adequacy_term = self.config['ROSIE_INFOS']['INSTALLATION']['LEGACY']['ADEQUACY_TERM']
+        date_start = self.config['ROSIE_INFOS']['INSTALLATION']['LEGACY']['DATE_START']
+        if self.calculate_days(self.date_status, date_start) > adequacy_term:
+            return status, reason
+
+        legacy = status != 'ignore'
+        quarantine = status == 'quarantine'
+        suffix = f' | Recurso dentro do prazo de adequacao de {adequacy_term} dia(s).'
+
+        status = status.where(~legacy, status + ' (legacy)').where(~quarantine, 'delete (legacy)')
+        reason = reason.where(~legacy, reason + suffix).where(~quarantine, 'Recurso nao possui uma classificacao valida.' + suffix)
+
+        return status, reason
+
     def handle_unique_management(self, lifecycle: dict, created_in: int):
         if created_in > (lifecycle['RETENTION_DAYS'] - lifecycle['DELETION_ALERT_COMING_DAYS']) and created_in <= lifecycle['RETENTION_DAYS']:
-            return 'deletion_coming', f'DELETE COMING - Tempo limite de retencao expirara em {abs(lifecycle["RETENTION_DAYS"] - created_in) + 1} dia(s).', lifecycle['RETENTION_DAYS'], lifecycle['TYPE_OF_MANAGEMENT']
+            return 'UNIQUE', 'deletion_coming', f'DELETE COMING - Tempo limite de retencao expirara em {abs(lifecycle["RETENTION_DAYS"] - created_in) + 1} dia(s).', lifecycle['RETENTION_DAYS'], lifecycle['TYPE_OF_MANAGEMENT']
         elif created_in > lifecycle['RETENTION_DAYS']:
             return 'UNIQUE', 'delete', 'DELETE - Tempo limite de retencao expirou.', lifecycle['RETENTION_DAYS'], lifecycle['TYPE_OF_MANAGEMENT']
         else:
             return 'UNIQUE', 'keep', 'KEEP - Recursos dentro do tempo limite de retencao.', lifecycle['RETENTION_DAYS'], lifecycle['TYPE_OF_MANAGEMENT']
 
-    def handle_resource_name_management(self, lifecycle: dict, resource_name: str, created_in: int, execution_in: int):
-        values = [value['VALUE'].upper() for value in lifecycle['DETAILS']['ALLOWED_VALUES']]
+    def handle_resource_name_management(self, lifecycle: dict, resource_name: str, created_in: int, execution_in: int, policy: dict = None):
+        policy = policy or self.build_policy(lifecycle)
+        values = policy['values']
         type_of_management = lifecycle['TYPE_OF_MANAGEMENT']
         separator = lifecycle['DETAILS']['SEPARATOR']
         affix = lifecycle['DETAILS']['AFFIX']
 
         classification = self.classify_resource(resource_name, separator, affix, values)
-        if classification not in values:
+        if classification not in policy['retention']:
             return self.handle_irregular_format(lifecycle, created_in)
 
-        retention_info = next(value for value in lifecycle['DETAILS']['ALLOWED_VALUES'] if value['VALUE'].upper() == classification)
+        retention_info = policy['retention'][classification]
         return self.handle_retention(retention_info, created_in, execution_in, classification, type_of_management)
     
-    def handle_tag_management(self, lifecycle: dict, monitoring: str, client: boto3.client, resource_name: str, created_in: int, execution_in: int):
-        tag_name = lifecycle['DETAILS']['TAG_NAME']
-        type_of_management = lifecycle['TYPE_OF_MANAGEMENT']
-        values = [value['VALUE'].upper() for value in lifecycle['DETAILS']['ALLOWED_VALUES']]
+    def prefetch_tags(self, monitoring: str, client: boto3.client = None):
+        """
+        Carrega em lote as tags dos recursos de um monitoramento gerenciado por TAG,
+        usando a Resource Groups Tagging API filtrada pelo `TAG_NAME` configurado.
+        Depois de uma carga bem-sucedida, recursos fora do resultado são tratados como
+        sem a tag, sem chamadas por recurso; se a carga falhar, as tags são buscadas por recurso.
+
+        Args:
+            monitoring (str): Nome do monitoramento (ex: GLUE_MONITORING).
+            client (boto3.client): Cliente do resourcegroupstaggingapi. Quando omitido, usa o da fábrica de clientes.
+        """
+        lifecycle = self.get_lifecycle(monitoring)
+        if lifecycle['TYPE_OF_MANAGEMENT'] != 'TAG':
+            return
+
+        resource_types = {
+            'GLUE_MONITORING': 'glue:job',
+            'STEP_FUNCTIONS_MONITORING': 'states:stateMachine',
+        }
+        if monitoring not in resource_types:
+            return
+
+        if client is None:
+            client = self.client_factory.client('resourcegroupstaggingapi', region=self.region)
+
+        tags = {}
+        try:
+            paginator = client.get_paginator('get_resources')
+            response_iterator = paginator.paginate(
+                ResourceTypeFilters=[resource_types[monitoring]],
+                TagFilters=[{'Key': lifecycle['DETAILS']['TAG_NAME']}],
+                ResourcesPerPage=100
+            )
+            for response in response_iterator:
+                for resource in response['ResourceTagMappingList']:
+                    tags[resource['ResourceARN']] = {tag['Key']: tag['Value'] for tag in resource['Tags']}
+        except Exception as e:
+            print(f"Erro ao carregar as tags em lote para o monitoramento {monitoring}, as tags serão buscadas por recurso: {e}")
+            return
+
+        self.tags_cache.update(tags)
+        self.prefetched_tags.add(monitoring)
+        print(f"Tags carregadas em lote para {len(tags)} recurso(s) do monitoramento {monitoring}")
 
+    def get_tags(self, monitoring: str, client: boto3.client, resource_name: str) -> dict:
         if monitoring == 'GLUE_MONITORING':
-            tags = client.get_tags(ResourceArn=f"arn:aws:glue:{self.region}:{self.account_id}:job/{resource_name}")['Tags']
-            classification = tags[tag_name].upper() if tags.get(tag_name) else 'N/A'
+            resource_arn = f"arn:aws:glue:{self.region}:{self.account_id}:job/{resource_name}"
         elif monitoring == 'STEP_FUNCTIONS_MONITORING':
-            tags = client.list_tags_for_resource(resourceArn=f"arn:aws:states:{self.region}:{self.account_id}:stateMachine:{resource_name}")['tags']
-            tags_dict = {}
-            for tag in tags:
-                tags_dict[tag['key']] = tag['value']
-            classification = tags_dict[tag_name].upper() if tags_dict.get(tag_name) else 'N/A'
+            resource_arn = f"arn:aws:states:{self.region}:{self.account_id}:stateMachine:{resource_name}"
         else:
             raise Exception(f'Monitoramento via TAG não foi cadastrado para o monitoramento {monitoring}.')
 
-        if classification not in values:
+        if resource_arn in self.tags_cache:
+            return self.tags_cache[resource_arn]
+
+        if monitoring in self.prefetched_tags:
+            return {}
+
+        if monitoring == 'GLUE_MONITORING':
+            self.tags_cache[resource_arn] = client.get_tags(ResourceArn=resource_arn)['Tags']
+        else:
+            tags = client.list_tags_for_resource(resourceArn=resource_arn)['tags']
+            self.tags_cache[resource_arn] = {tag['key']: tag['value'] for tag in tags}
+
+        return self.tags_cache[resource_arn]
+
+    def handle_tag_management(self, lifecycle: dict, monitoring: str, client: boto3.client, resource_name: str, created_in: int, execution_in: int, policy: dict = None):
+        policy = policy or self.build_policy(lifecycle)
+        tag_name = lifecycle['DETAILS']['TAG_NAME']
+        type_of_management = lifecycle['TYPE_OF_MANAGEMENT']
+
+        tags = self.get_tags(monitoring, client, resource_name)
+        classification = tags[tag_name].upper() if tags.get(tag_name) else 'N/A'
+
+        if classification not in policy['retention']:
             return self.handle_irregular_format(lifecycle, created_in)
         
-        retention_info = next(value for value in lifecycle['DETAILS']['ALLOWED_VALUES'] if value['VALUE'].upper() == classification)
+        retention_info = policy['retention'][classification]
         return self.handle_retention(retention_info, created_in, execution_in, classification, type_of_management)
 
     def classify_resource(self, resource_name, separator, affix, values):
@@ -186,48 +842,456 @@ class RosieLifecycleManager:
             else:
                 return classification, 'keep', 'KEEP - Recurso ativo. Não há verificação de ociosidade.', None, type_of_management
 
+class RosieS3MultipartSink:
+    """
+    Arquivo somente escrita que envia o conteúdo para o S3 em partes de um
+    multipart upload, mantendo em memória no máximo uma parte por vez.
+
+    Attributes:
+        client (boto3.client): Cliente do S3.
+        bucket (str): Bucket de destino.
+        key (str): Chave de destino.
+        part_size (int): Tamanho mínimo de cada parte em bytes (o S3 exige ao menos 5 MB).
+    """
+    def __init__(self, client: boto3.client, bucket: str, key: str, part_size: int = 8 * 1024 * 1024):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = max(part_size, 5 * 1024 * 1024)
+        self.buffer = bytearray()
+        self.parts = []
+        self.position = 0
+        self.closed = False
+        self.upload_id = self.client.create_multipart_upload(Bucket=bucket, Key=key)['UploadId']
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def write(self, data):
+        self.buffer.extend(data)
+        self.position += len(data)
+        if len(self.buffer) >= self.part_size:
+            self.upload_part()
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def upload_part(self):
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=len(self.parts) + 1,
+            Body=bytes(self.buffer)
+        )
+        self.parts.append({'ETag': response['ETag'], 'PartNumber': len(self.parts) + 1})
+        self.buffer = bytearray()
+
+    def close(self):
+        if self.closed:
+            return
+        if self.buffer or not self.parts:
+            self.upload_part()
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            MultipartUpload={'Parts': self.parts}
+        )
+        self.closed = True
+
+    def abort(self):
+        if not self.closed:
+            self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+            self.closed = True
+
+class RosieControlSchema:
+    """
+    Schema tipado da tabela de controle da ROSIE, compartilhado pelos monitoramentos,
+    pelo cleaner e pelo escritor Parquet. Colunas `string` viram `string` no pandas e
+    no Arrow; colunas `int` viram `Int64` no pandas e `int32` no Arrow.
+
+    Attributes:
+        columns (list): Colunas da tabela (`{'Name', 'Type'}`), por padrão `control_table_schema`.
+    """
+    def __init__(self, columns: list = None):
+        self.columns = columns or control_table_schema
+        self.names = [column['Name'] for column in self.columns]
+
+    def to_arrow(self):
+        return pa.schema([(column['Name'], {'string': pa.string(), 'int': pa.int32()}[column['Type']]) for column in self.columns])
+
+    def coerce(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converte as colunas do DataFrame para os tipos nulos do schema em uma única passada
+        vetorizada por coluna. Colunas ausentes são criadas vazias, valores inválidos em
+        colunas `int` viram nulos e valores decimais são truncados. Colunas fora do schema
+        são mantidas ao final.
+
+        Args:
+            df (pd.DataFrame): Dados a serem tipados.
+        return:
+            pd.DataFrame: Dados com as colunas do schema tipadas e ordenadas.
+        """
+        df = df.copy()
+        for column in self.columns:
+            name = column['Name']
+            if name not in df:
+                df[name] = None
+
+            if column['Type'] == 'int':
+                values = pd.to_numeric(df[name], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+                values = np.where(np.isfinite(values), values, np.nan)
+                df[name] = pd.Series(np.trunc(values), index=df.index).astype('Int64')
+            else:
+                df[name] = df[name].astype('string')
+
+        return df[self.names + [name for name in df.columns if name not in self.names]]
+
+    def coerce_record(self, record: dict) -> dict:
+        """
+        Versão de `coerce` para um único registro, com as mesmas regras: valores nulos ou
+        inválidos em colunas `int` viram None e valores decimais são truncados.
+        """
+        row = {}
+        for column in self.columns:
+            value = record.get(column['Name'])
+            if value is None or (np.ndim(value) == 0 and not isinstance(value, str) and pd.isna(value)):
+                row[column['Name']] = None
+            elif column['Type'] == 'string':
+                row[column['Name']] = str(value)
+            else:
+                try:
+                    number = float(value)
+                except (ValueError, TypeError):
+                    number = None
+                row[column['Name']] = int(number) if number is not None and np.isfinite(number) else None
+        return row
+
+class RosieParquetWriter:
+    """
+    Escritor Parquet incremental para a tabela de controle da ROSIE.
+
+    Os registros são acumulados em row groups de `row_group_size` linhas, gravados com o
+    schema explícito da tabela e enviados por multipart upload. Ao passar de
+    `max_file_size` bytes o arquivo é fechado e um novo é iniciado.
+
+    Attributes:
+        client (boto3.client): Cliente do S3.
+        bucket (str): Bucket de destino.
+        prefix (str): Prefixo da partição de destino.
+        file_name (str): Prefixo do nome dos arquivos gerados.
+        row_group_size (int): Quantidade de linhas por row group.
+        max_file_size (int): Tamanho, em bytes, a partir do qual um novo arquivo é iniciado.
+    """
+    def __init__(self, client: boto3.client, bucket: str, prefix: str, file_name: str, row_group_size: int = 10000, max_file_size: int = 128 * 1024 * 1024):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.file_name = file_name
+        self.row_group_size = row_group_size
+        self.max_file_size = max_file_size
+        self.control_schema = RosieControlSchema()
+        self.schema = self.control_schema.to_arrow()
+        self.rows = []
+        self.sink = None
+        self.writer = None
+        self.files = []
+        self.total_rows = 0
+        self.lock = threading.Lock()
+
+    def write(self, record: dict):
+        row = self.control_schema.coerce_record(record)
+        with self.lock:
+            self.rows.append(row)
+            if len(self.rows) >= self.row_group_size:
+                self.flush()
+
+    def write_frame(self, df: pd.DataFrame):
+        """
+        Grava um DataFrame inteiro, tipado pelo schema da tabela, em row groups de
+        `row_group_size` linhas.
+
+        Args:
+            df (pd.DataFrame): Registros a serem gravados.
+        """
+        self.flush()
+        df = self.control_schema.coerce(df)[self.control_schema.names]
+        table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+        for batch in table.to_batches(max_chunksize=self.row_group_size):
+            self.write_batch(batch)
+
+    def flush(self):
+        if not self.rows:
+            return
+
+        self.write_batch(pa.RecordBatch.from_pylist(self.rows, schema=self.schema))
+        self.rows = []
+
+    def write_batch(self, batch):
+        if self.writer is None:
+            key = f'{self.prefix}/{self.file_name}-{uuid4()}.parquet'
+            self.sink = RosieS3MultipartSink(self.client, self.bucket, key)
+            self.writer = pq.ParquetWriter(self.sink, self.schema, compression='snappy')
+            self.files.append(f's3://{self.bucket}/{key}')
+
+        self.writer.write_batch(batch)
+        self.total_rows += batch.num_rows
+
+        if self.sink.tell() >= self.max_file_size:
+            self.close_file()
+
+    def close_file(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.sink.close()
+            self.writer = None
+            self.sink = None
+
+    def close(self) -> list:
+        try:
+            self.flush()
+            self.close_file()
+        except Exception:
+            self.abort()
+            raise
+
+        return self.files
+
+    def abort(self):
+        if self.sink is not None:
+            self.sink.abort()
+        self.writer = None
+        self.sink = None
+        self.rows = []
+
 class RosieTableMonitor:
 
-    def __init__(self, config: dict, date_status: str):
+    def __init__(self, config: dict, date_status: str, client_factory: RosieClientFactory = None):
         self.config = config
         self.date_status = date_status
-        self.session = boto3.Session()
+        self.client_factory = client_factory or RosieClientFactory(config)
         self.ano = self.date_status.split('-')[0]
         self.mes = self.date_status.split('-')[1]
         self.dia = self.date_status.split('-')[2]
         self.database = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['DATABASE_NAME']
         self.table = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['TABLE_NAME']
         self.bucket = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['BUCKET_NAME']
+        self.table_data = None
+        self.defer_partitions = False
+        self.pending_partitions = []
+        self.partition_projection = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME'].get('PARTITION_PROJECTION', False)
+        self.background_writes = False
+        self.executor = None
+        self.background_futures = []
+        self.lock = threading.Lock()
+
+    def open_writer(self, service: str, file_name: str = None) -> RosieParquetWriter:
+        """
+        Abre um escritor Parquet incremental para a partição do dia do serviço informado.
+
+        Args:
+            service (str): Tipo da partição (GLUE, S3, CLEANER, ...).
+            file_name (str): Prefixo do nome dos arquivos. Padrão: a data da partição.
+        return:
+            RosieParquetWriter: Escritor que recebe os registros por `write` e finaliza por `close`.
+        """
+        runtime = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']
+
+        return RosieParquetWriter(
+            client=self.client_factory.client('s3'),
+            bucket=self.bucket,
+            prefix=f'ROSIE/{self.table}/ano_dt_safra={self.ano}/mes_dt_safra={self.mes}/dia_dt_safra={self.dia}/tipo={service}',
+            file_name=file_name or self.date_status,
+            row_group_size=runtime.get('PARQUET_ROW_GROUP_SIZE', 10000),
+            max_file_size=runtime.get('PARQUET_MAX_FILE_SIZE_MB', 128) * 1024 * 1024
+        )
+
+    def submit(self, func, *args):
+        """
+        Executa `func` em uma thread dedicada às gravações quando `background_writes` está
+        ativo, preservando a ordem de submissão, ou imediatamente caso contrário.
+        """
+        if not self.background_writes:
+            return func(*args)
+
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=1)
+            self.background_futures.append(self.executor.submit(func, *args))
+
+    def wait(self):
+        """
+        Aguarda as gravações submetidas em segundo plano, propagando o primeiro erro.
+        """
+        futures = self.background_futures
+        self.background_futures = []
+        for future in futures:
+            future.result()
 
-    def save_result(self, verify_list: list, service: str):
-        uuid = str(uuid4())
+    @contextmanager
+    def result_writer(self, service: str, file_name: str = None):
+        """
+        Abre o escritor da partição do dia do serviço para que os registros sejam gravados
+        à medida que são classificados, sem acumular a lista inteira em memória. O arquivo é
+        finalizado ao sair do bloco, ou descartado se o bloco falhar.
 
-        if len(verify_list) > 0:
-            df = pd.DataFrame(verify_list, columns=verify_list[0].keys())
-            s3_url = f's3://{self.bucket}/ROSIE/{self.table}/ano_dt_safra={self.ano}/mes_dt_safra={self.mes}/dia_dt_safra={self.dia}/tipo={service}/{self.date_status}-{uuid}.parquet'
-            df.to_parquet(s3_url)
-            print(f'Dados salvos com sucesso em {s3_url}')
+        Args:
+            service (str): Tipo da partição (GLUE, S3, CLEANER, ...).
+            file_name (str): Prefixo do nome dos arquivos. Padrão: a data da partição.
+        """
+        writer = self.open_writer(service, file_name)
+        try:
+            yield writer
+        except BaseException:
+            writer.abort()
+            raise
+
+        files = writer.close()
+        if files:
+            for s3_url in files:
+                print(f'Dados salvos com sucesso em {s3_url}')
         else:
             print('Nenhum dado para salvar')
 
+    def save_result(self, verify_list, service: str, file_name: str = None):
+        self.submit(self.write_result, verify_list, service, file_name)
+
+    def write_result(self, verify_list, service: str, file_name: str = None):
+        with self.result_writer(service, file_name) as writer:
+            if isinstance(verify_list, pd.DataFrame):
+                writer.write_frame(verify_list)
+            else:
+                for verify_item in verify_list:
+                    writer.write(verify_item)
+
+    def clear_partition(self, service: str, file_name: str = None):
+        """
+        Remove os arquivos já gravados na partição do dia do serviço informado, para que
+        uma nova gravação substitua a anterior em vez de duplicar os registros.
+
+        Args:
+            service (str): Tipo da partição (GLUE, S3, CLEANER, ...).
+            file_name (str): Remove apenas os arquivos gravados com este prefixo de nome
+                (o mesmo informado em `save_result`). Quando omitido, remove a partição inteira.
+        """
+        client = self.client_factory.client('s3')
+        paginator = client.get_paginator('list_objects_v2')
+        prefix = f'ROSIE/{self.table}/ano_dt_safra={self.ano}/mes_dt_safra={self.mes}/dia_dt_safra={self.dia}/tipo={service}/'
+        if file_name:
+            prefix = f'{prefix}{file_name}-'
+
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            objects = [{'Key': file['Key']} for file in page.get('Contents', [])]
+            if objects:
+                client.delete_objects(Bucket=self.bucket, Delete={'Objects': objects, 'Quiet': True})
+
+    def save_metrics(self, metrics: RosieMetrics):
+        """
+        Grava as métricas de chamadas à API e de tempo por fase da execução na partição
+        METRICS do dia. Cada execução gera o próprio arquivo, identificado por `dt_inicio_execucao`.
+
+        Args:
+            metrics (RosieMetrics): Métricas acumuladas pela fábrica de clientes.
+        """
+        if not metrics.enabled:
+            return
+
+        self.save_result(verify_list=metrics.to_records(self.date_status), service='METRICS')
+        self.create_partition(service='METRICS')
+
     def create_partition(self, service: str):
+        if self.partition_projection:
+            return
+
+        if self.defer_partitions:
+            with self.lock:
+                self.pending_partitions.append((self.date_status, service))
+            return
+
+        self.submit(self.register_partitions, [(self.date_status, service)])
+
+    def flush_partitions(self):
+        """
+        Registra em lote as partições acumuladas enquanto `defer_partitions` estava ativo.
+        """
+        with self.lock:
+            pending = self.pending_partitions
+            self.pending_partitions = []
+        self.register_partitions(pending)
+
+    def register_partitions(self, partitions: list, chunk_size: int = 100):
+        """
+        Registra partições na tabela de controle com `batch_create_partition`, em blocos
+        de até 100 partições. Partições já existentes são ignoradas.
+
+        Args:
+            partitions (list): Tuplas (data YYYY-MM-DD, serviço).
+            chunk_size (int): Quantidade de partições por chamada (máximo de 100 no Glue).
+        """
+        if not partitions or self.partition_projection:
+            return
+
         table_data = self.get_current_schema()
-        partition_list = self.generate_partition(table_data, service)
+        partition_list = []
+        for date_status, service in dict.fromkeys(partitions):
+            partition_list.extend(self.generate_partition(table_data, service, date_status))
+
+        for i in range(0, len(partition_list), chunk_size):
+            chunk = partition_list[i:i + chunk_size]
+            try:
+                response = self.glue_client.batch_create_partition(
+                    DatabaseName=self.database,
+                    TableName=self.table,
+                    PartitionInputList=chunk
+                )
+            except Exception as e:
+                print(f"Erro ao criar partição para a tabela {self.table} no banco de dados {self.database}: {e}")
+                sys.exit(1)
 
-        try:
-            response = self.session.client('glue').batch_create_partition(
-                DatabaseName=self.database,
-                TableName=self.table,
-                PartitionInputList=partition_list
-            )
-            print(f"Partição criada com sucesso para a tabela {self.table} no banco de dados {self.database}") 
-        except Exception as e:
-            print(f"Erro ao criar partição para a tabela {self.table} no banco de dados {self.database}: {e}")
-            sys.exit(1)
+            errors = [error for error in response.get('Errors', []) if error['ErrorDetail']['ErrorCode'] != 'AlreadyExistsException']
+            if errors:
+                print(f"Erro ao criar partição para a tabela {self.table} no banco de dados {self.database}: {errors}")
+                sys.exit(1)
+
+            print(f"{len(chunk)} partição(ões) criada(s) com sucesso para a tabela {self.table} no banco de dados {self.database}")
+
+    def backfill_partitions(self, start_date: str, end_date: str, services: list):
+        """
+        Registra as partições de um intervalo de datas para os serviços informados.
+
+        Args:
+            start_date (str): Data inicial (YYYY-MM-DD), inclusiva.
+            end_date (str): Data final (YYYY-MM-DD), inclusiva.
+            services (list): Tipos das partições (GLUE, S3, CLEANER, ...).
+        """
+        start = datetime.datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.datetime.strptime(end_date, '%Y-%m-%d')
+        dates = [(start + datetime.timedelta(days=day)).strftime('%Y-%m-%d') for day in range((end - start).days + 1)]
+
+        self.register_partitions([(date_status, service) for date_status in dates for service in services])
+
+    @property
+    def glue_client(self):
+        """
+        Cliente do Glue, criado apenas no primeiro registro de partições. Com
+        `partition_projection` nenhuma chamada de partição é feita e o cliente não é criado.
+        """
+        return self.client_factory.client('glue')
 
     def get_current_schema(self) -> dict:
+        if self.partition_projection:
+            return None
+
+        if self.table_data is not None:
+            return self.table_data
+
         try:
-            response = self.session.client('glue').get_table(
+            response = self.glue_client.get_table(
                 DatabaseName=self.database,
                 Name=self.table
             )
@@ -242,16 +1306,18 @@ class RosieTableMonitor:
         table_data['serde_info'] = response['Table']['StorageDescriptor']['SerdeInfo']
         table_data['partition_keys'] = response['Table']['PartitionKeys']
 
+        self.table_data = table_data
         return table_data
     
-    def generate_partition(self, table_data: dict, service: str) -> list:
+    def generate_partition(self, table_data: dict, service: str, date_status: str = None) -> list:
+        ano, mes, dia = (date_status or self.date_status).split('-')
         partition_list = []
-        part_location = f'{table_data["location"]}/ano_dt_safra={self.ano}/mes_dt_safra={self.mes}/dia_dt_safra={self.dia}/tipo={service}'
+        part_location = f'{table_data["location"]}/ano_dt_safra={ano}/mes_dt_safra={mes}/dia_dt_safra={dia}/tipo={service}'
         input_dict = {
             'Values': [
-                self.ano,
-                self.mes,
-                self.dia,
+                ano,
+                mes,
+                dia,
                 service
             ],
             'StorageDescriptor': {
@@ -265,12 +1331,30 @@ class RosieTableMonitor:
         return partition_list
     
 class RosieUtils:
-    def __init__(self):
-        pass
+    def __init__(self, client_factory: RosieClientFactory = None):
+        self.client_factory = client_factory or RosieClientFactory()
 
-    def get_size_s3(self, client: boto3.client, bucket: str, folder: str):
-        tmp_size_list = []
+    def get_client(self, client: boto3.client = None) -> boto3.client:
+        return client or self.client_factory.client('s3')
+
+    def get_prefix_stats(self, client: boto3.client, bucket: str, folder: str) -> dict:
+        """
+        Percorre um prefixo do S3 uma única vez, agregando tamanho, quantidade de
+        objetos e as datas mínima e máxima de LastModified sem manter a listagem em memória.
 
+        Args:
+            client (boto3.client): Cliente do S3. Quando `None`, usa o da fábrica de clientes.
+            bucket (str): Nome do bucket.
+            folder (str): Prefixo a ser agregado.
+        return:
+            dict: `size_bytes`, `object_count`, `min_last_modified` e `max_last_modified` (YYYY-MM-DD).
+        """
+        total_bytes = 0
+        object_count = 0
+        min_last_modified = None
+        max_last_modified = None
+
+        client = self.get_client(client)
         paginator = client.get_paginator('list_objects_v2')
         response_iterator = paginator.paginate(
             Bucket=bucket,
@@ -278,129 +1362,539 @@ class RosieUtils:
         )
 
         for response in response_iterator:
-            if "Contents" in response:
-                for file in response['Contents']:
-                    tmp_size_list.append(file['Size'])
-                    print(f"Found file: {file['Key']} with size: {file['Size']}")
-
-            if "CommonPrefixes" in response:
-                for r in response['CommonPrefixes']:
-                    sub_response_iterator = paginator.paginate(
-                        Bucket=bucket,
-                        Prefix=r['Prefix']
-                    )
-                    for sub_response in sub_response_iterator:
-                        files = sub_response.get('Contents')
-                        if files:
-                            for file in files:
-                                tmp_size_list.append(file['Size'])
-                                print(f"Found file in sub-prefix: {file['Key']} with size: {file['Size']}")
-
-        total_bytes = sum(tmp_size_list)
-        total_size = total_bytes * 0.000001
-        total_size = "%.2f" % total_size
+            for file in response.get('Contents', []):
+                total_bytes += file['Size']
+                object_count += 1
+                if min_last_modified is None or file['LastModified'] < min_last_modified:
+                    min_last_modified = file['LastModified']
+                if max_last_modified is None or file['LastModified'] > max_last_modified:
+                    max_last_modified = file['LastModified']
+
+        return {
+            'size_bytes': total_bytes,
+            'object_count': object_count,
+            'min_last_modified': min_last_modified.strftime('%Y-%m-%d') if min_last_modified else None,
+            'max_last_modified': max_last_modified.strftime('%Y-%m-%d') if max_last_modified else None,
+        }
 
-        return f"{total_size}mb"
-    
-    def creation_date_s3(self, client: boto3.client, bucket: str, folder: str):
+    def get_prefix_sizes(self, client: boto3.client, bucket: str, folders: list) -> dict:
+        """
+        Calcula o tamanho de vários prefixos de um mesmo bucket listando cada prefixo raiz
+        uma única vez. Prefixos repetidos ou aninhados em outro prefixo não são listados
+        novamente: cada objeto é atribuído, por uma trie de caracteres, a todos os prefixos
+        que casam com a sua chave, com a mesma semântica do `Prefix` do `list_objects_v2`.
+
+        Args:
+            client (boto3.client): Cliente do S3. Quando `None`, usa o da fábrica de clientes.
+            bucket (str): Nome do bucket.
+            folders (list): Prefixos a serem medidos.
+        return:
+            dict: Tamanho em bytes de cada prefixo.
+        """
+        folders = sorted(set(folders))
+        sizes = {folder: 0 for folder in folders}
+
+        trie = {}
+        for folder in folders:
+            node = trie
+            for char in folder:
+                node = node.setdefault(char, {})
+            node[None] = folder
+
+        roots = []
+        for folder in folders:
+            if not roots or not folder.startswith(roots[-1]):
+                roots.append(folder)
+
+        client = self.get_client(client)
+        paginator = client.get_paginator('list_objects_v2')
+        for root in roots:
+            response_iterator = paginator.paginate(
+                Bucket=bucket,
+                Prefix=root
+            )
 
-        tmp_created_in = []
+            for response in response_iterator:
+                for file in response.get('Contents', []):
+                    node = trie
+                    if None in node:
+                        sizes[node[None]] += file['Size']
+                    for char in file['Key']:
+                        node = node.get(char)
+                        if node is None:
+                            break
+                        if None in node:
+                            sizes[node[None]] += file['Size']
+
+        return sizes
+
+    def list_prefix(self, client: boto3.client, bucket: str, prefix: str):
+        """
+        Lista um nível de um prefixo do S3 paginando `list_objects_v2` até o fim.
 
-        response = client.list_objects_v2(
+        Args:
+            client (boto3.client): Cliente do S3. Quando `None`, usa o da fábrica de clientes.
+            bucket (str): Nome do bucket.
+            prefix (str): Prefixo a ser listado.
+        return:
+            generator: Tuplas (`folder` | `file`, chave) na ordem em que as páginas chegam.
+        """
+        client = self.get_client(client)
+        paginator = client.get_paginator('list_objects_v2')
+        response_iterator = paginator.paginate(
             Bucket=bucket,
-            Prefix=folder,
+            Prefix=prefix,
             Delimiter='/'
         )
 
-        if "Contents" in response:
-            for r in response['Contents']:
-                tmp_created_in.append(r['LastModified'].strftime('%Y-%m-%d'))
+        for response in response_iterator:
+            for item in response.get('CommonPrefixes', []):
+                yield 'folder', item['Prefix']
+            for item in response.get('Contents', []):
+                yield 'file', item['Key']
 
-        if "CommonPrefixes" in response:
-            for r in response['CommonPrefixes']:
-                response = client.list_objects_v2(
-                    Bucket=bucket,
-                    Prefix=r['Prefix']
-                )
-                files = response.get('Contents')
-                if files:
-                    for file in files:
-                        tmp_created_in.append(file['LastModified'].strftime('%Y-%m-%d'))
+    def format_size(self, total_bytes: int) -> str:
+        total_size = total_bytes * 0.000001
+        total_size = "%.2f" % total_size
+
+        return f"{total_size}mb"
+
+    def get_size_s3(self, client: boto3.client, bucket: str, folder: str):
+        stats = self.get_prefix_stats(client, bucket, folder)
 
-        return min(tmp_created_in), max(tmp_created_in)
+        return self.format_size(stats['size_bytes'])
     
+    def creation_date_s3(self, client: boto3.client, bucket: str, folder: str):
+        stats = self.get_prefix_stats(client, bucket, folder)
+
+        return stats['min_last_modified'], stats['max_last_modified']
+    
+class RosieInventory:
+    """
+    Classe para leitura dos relatórios do S3 Inventory, usada como fonte alternativa
+    à listagem via API nos monitoramentos de S3 e DATA CATALOG.
+
+    O inventário de cada bucket é informado como `s3://<bucket-destino>/<prefixo>/<bucket-origem>/<id-configuracao>/`
+    e o manifest mais recente nesse caminho é utilizado.
+    """
+    def __init__(self):
+        self.manifests = {}
+
+    def get_latest_manifest(self, client: boto3.client, inventory: str) -> dict:
+        bucket = inventory.split('/')[2]
+        prefix = '/'.join(inventory.split('/')[3:])
+        prefix = prefix if prefix.endswith('/') else f'{prefix}/'
+
+        paginator = client.get_paginator('list_objects_v2')
+        response_iterator = paginator.paginate(
+            Bucket=bucket,
+            Prefix=prefix,
+            Delimiter='/'
+        )
+
+        dates = []
+        for response in response_iterator:
+            for item in response.get('CommonPrefixes', []):
+                if item['Prefix'][len(prefix):][:1].isdigit():
+                    dates.append(item['Prefix'])
+
+        if not dates:
+            raise Exception(f"Nenhum manifest do S3 Inventory encontrado em {inventory}")
+
+        response = client.get_object(
+            Bucket=bucket,
+            Key=f'{max(dates)}manifest.json'
+        )
+        manifest = json.loads(response['Body'].read())
+        manifest['inventoryBucket'] = bucket
+
+        return manifest
+
+    def read_inventory_file(self, client: boto3.client, manifest: dict, key: str, chunk_size: int = 1000000):
+        """
+        Lê um arquivo de dados do inventário em blocos de até `chunk_size` objetos, com as
+        colunas `key`, `size` e `last_modified_date`, ordenados por chave dentro do bloco.
+
+        return:
+            generator: DataFrames de cada bloco.
+        """
+        body = io.BytesIO(client.get_object(Bucket=manifest['inventoryBucket'], Key=key)['Body'].read())
+        file_format = manifest['fileFormat'].upper()
+
+        if file_format == 'CSV':
+            schema = [column.strip() for column in manifest['fileSchema'].split(',')]
+            chunks = pd.read_csv(
+                body,
+                compression='gzip',
+                header=None,
+                names=schema,
+                usecols=['Key', 'Size', 'LastModifiedDate'],
+                dtype={'Key': str},
+                chunksize=chunk_size
+            )
+            chunks = (
+                chunk.rename(columns={'Key': 'key', 'Size': 'size', 'LastModifiedDate': 'last_modified_date'}).assign(key=lambda df: df['key'].map(unquote_plus))
+                for chunk in chunks
+            )
+        elif file_format == 'PARQUET':
+            parquet_file = pq.ParquetFile(body)
+            chunks = (batch.to_pandas() for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=['key', 'size', 'last_modified_date']))
+        elif file_format == 'ORC':
+            import pyarrow.orc as orc
+            orc_file = orc.ORCFile(body)
+            chunks = (orc_file.read_stripe(stripe, columns=['key', 'size', 'last_modified_date']).to_pandas() for stripe in range(orc_file.nstripes))
+        else:
+            raise Exception(f"Formato de arquivo do S3 Inventory não suportado: {manifest['fileFormat']}")
+
+        for df in chunks:
+            df['size'] = df['size'].fillna(0).astype('int64')
+            df['last_modified_date'] = pd.to_datetime(df['last_modified_date'], utc=True)
+            yield df.sort_values('key', ignore_index=True)
+
+    def iter_inventory(self, client: boto3.client, inventory: str):
+        """
+        Percorre o inventário mais recente bloco a bloco, sem manter os objetos em memória
+        entre os blocos. O manifest fica em cache por caminho.
+
+        Args:
+            client (boto3.client): Cliente do S3.
+            inventory (str): Caminho S3 da configuração do inventário.
+        return:
+            generator: DataFrames com `key`, `size` e `last_modified_date`, ordenados por chave.
+        """
+        if inventory not in self.manifests:
+            self.manifests[inventory] = self.get_latest_manifest(client, inventory)
+        manifest = self.manifests[inventory]
+
+        total = 0
+        for file in manifest['files']:
+            for df in self.read_inventory_file(client, manifest, file['key']):
+                total += len(df)
+                yield df
+
+        print(f"Inventário {inventory} lido com {total} objeto(s)")
+
+    def get_prefix_range(self, df: pd.DataFrame, prefix: str) -> pd.DataFrame:
+        lower = df['key'].searchsorted(prefix, side='left')
+        upper = df['key'].searchsorted(prefix + '\U0010ffff', side='left')
+
+        return df.iloc[lower:upper]
+
+    def merge_stats(self, stats: dict, key: str, size_bytes: int, object_count: int, min_last_modified, max_last_modified, is_folder: bool = False):
+        current = stats.get(key)
+        if current is None:
+            stats[key] = {
+                'size_bytes': int(size_bytes),
+                'object_count': int(object_count),
+                'min_last_modified': min_last_modified,
+                'max_last_modified': max_last_modified,
+                'is_folder': bool(is_folder),
+            }
+            return
+
+        current['size_bytes'] += int(size_bytes)
+        current['object_count'] += int(object_count)
+        current['min_last_modified'] = min(current['min_last_modified'], min_last_modified)
+        current['max_last_modified'] = max(current['max_last_modified'], max_last_modified)
+        current['is_folder'] = current['is_folder'] or bool(is_folder)
+
+    def format_stats(self, stats: dict) -> dict:
+        return {
+            'size_bytes': stats['size_bytes'],
+            'object_count': stats['object_count'],
+            'min_last_modified': stats['min_last_modified'].strftime('%Y-%m-%d') if stats['object_count'] else None,
+            'max_last_modified': stats['max_last_modified'].strftime('%Y-%m-%d') if stats['object_count'] else None,
+        }
+
+    def get_folder_stats(self, client: boto3.client, inventory: str, folders: list) -> dict:
+        """
+        Soma tamanho, quantidade e datas dos objetos de cada pasta em uma única leitura do
+        inventário, agregando cada bloco assim que ele é lido.
+
+        Args:
+            client (boto3.client): Cliente do S3.
+            inventory (str): Caminho S3 da configuração do inventário.
+            folders (list): Pastas (prefixos) a serem agregadas.
+        return:
+            dict: Estatísticas de cada pasta no formato de `RosieUtils.get_prefix_stats`.
+        """
+        folders = set(folders)
+        stats = {}
+
+        for df in self.iter_inventory(client, inventory):
+            for folder in folders:
+                subset = self.get_prefix_range(df, folder)
+                if subset.empty:
+                    continue
+                self.merge_stats(stats, folder, subset['size'].sum(), len(subset), subset['last_modified_date'].min(), subset['last_modified_date'].max())
+
+        empty = {'size_bytes': 0, 'object_count': 0, 'min_last_modified': None, 'max_last_modified': None}
+        return {folder: self.format_stats(stats[folder]) if folder in stats else dict(empty) for folder in folders}
+
+    def aggregate_prefixes(self, client: boto3.client, inventory: str, prefixes: list) -> dict:
+        """
+        Agrupa os objetos de cada prefixo pelo primeiro nível abaixo dele, equivalente
+        a uma listagem com `Delimiter='/'` seguida da agregação de cada pasta. O inventário
+        é lido uma única vez para todos os prefixos e cada bloco é agregado e descartado,
+        de forma que a memória cresce com a quantidade de pastas, não de objetos.
+
+        Args:
+            client (boto3.client): Cliente do S3.
+            inventory (str): Caminho S3 da configuração do inventário.
+            prefixes (list): Prefixos monitorados.
+        return:
+            dict: Para cada prefixo, lista de tuplas (`folder` | `file`, chave, estatísticas no formato de `RosieUtils.get_prefix_stats`).
+        """
+        entries = {prefix: {} for prefix in prefixes}
+
+        for df in self.iter_inventory(client, inventory):
+            for prefix in entries:
+                subset = self.get_prefix_range(df, prefix)
+                if subset.empty:
+                    continue
+
+                rest = subset['key'].str.slice(len(prefix))
+                is_folder = rest.str.contains('/', regex=False)
+                entry = prefix + rest.str.split('/', n=1).str[0] + is_folder.map({True: '/', False: ''})
+
+                grouped = subset.assign(entry=entry, is_folder=is_folder).groupby('entry').agg(
+                    size_bytes=('size', 'sum'),
+                    object_count=('size', 'size'),
+                    min_last_modified=('last_modified_date', 'min'),
+                    max_last_modified=('last_modified_date', 'max'),
+                    is_folder=('is_folder', 'max'),
+                )
+
+                for row in grouped.itertuples():
+                    self.merge_stats(entries[prefix], row.Index, row.size_bytes, row.object_count, row.min_last_modified, row.max_last_modified, row.is_folder)
+
+        return {
+            prefix: [('folder' if stats['is_folder'] else 'file', obj, self.format_stats(stats)) for obj, stats in sorted(prefix_entries.items())]
+            for prefix, prefix_entries in entries.items()
+        }
+
+class RosieStateStore:
+    """
+    Classe para persistir o estado incremental dos monitoramentos no bucket da ROSIE.
+
+    Attributes:
+        config (dict): Input do arquivo de configuração.
+        client_factory (RosieClientFactory): Fábrica de clientes compartilhada.
+    """
+    def __init__(self, config: dict, client_factory: RosieClientFactory = None):
+        self.client_factory = client_factory or RosieClientFactory(config)
+        self.bucket = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['BUCKET_NAME']
+
+    def get_key(self, name: str):
+        return f'ROSIE/state/{name}.json'
+
+    def load(self, name: str) -> dict:
+        try:
+            response = self.client_factory.client('s3').get_object(
+                Bucket=self.bucket,
+                Key=self.get_key(name)
+            )
+        except Exception as e:
+            print(f"Estado '{name}' não encontrado, iniciando do zero: {e}")
+            return {}
+
+        return json.loads(response['Body'].read())
+
+    def save(self, name: str, state: dict):
+        self.client_factory.client('s3').put_object(
+            Bucket=self.bucket,
+            Key=self.get_key(name),
+            Body=json.dumps(state)
+        )
+        print(f"Estado '{name}' salvo com sucesso em s3://{self.bucket}/{self.get_key(name)}")
+
 class Rosie:
-    def __init__(self, config):
-        self.session = boto3.Session()
+    def __init__(self, config, max_workers: int = None, session: boto3.Session = None, client_factory: RosieClientFactory = None):
         self.config = config
+        self.max_workers = max_workers or config['ROSIE_INFOS']['INSTALLATION']['RUNTIME'].get('MAX_WORKERS', 10)
+        self.client_factory = client_factory or RosieClientFactory(config, session)
+        self.session = self.client_factory.session
         self.date_status = str(datetime.datetime.now().strftime('%Y-%m-%d'))
-        self.lifecycle_manager = RosieLifecycleManager(config, self.date_status)
-        self.table_monitor = RosieTableMonitor(config, self.date_status)
-        self.rosie_utils = RosieUtils()
+        self.lifecycle_manager = RosieLifecycleManager(config, self.date_status, self.client_factory)
+        self.table_monitor = RosieTableMonitor(config, self.date_status, self.client_factory)
+        self.rosie_utils = RosieUtils(self.client_factory)
+        self.state_store = RosieStateStore(config, self.client_factory)
+        self.inventory = RosieInventory()
+        self.metrics = self.client_factory.metrics
+
+    def client(self, service: str, max_pool_connections: int = None):
+        """
+        Retorna o cliente compartilhado do serviço a partir da fábrica de clientes.
+        """
+        return self.client_factory.client(service, max_pool_connections=max_pool_connections)
 
-    def monitor_glue(
-            self
+    def save_metrics(self):
+        """
+        Grava as métricas da execução (chamadas à API e tempo por fase) na partição METRICS.
+        Deve ser chamado ao final da execução, depois dos monitoramentos e da limpeza.
+        """
+        self.table_monitor.save_metrics(self.metrics)
+        self.table_monitor.wait()
+
+    def enrich(self, func, items: list):
+        """
+        Aplica `func` a cada recurso listado usando um pool de threads limitado a
+        `max_workers`, preservando a ordem dos itens. Com `max_workers` igual a 1
+        a execução é serial, o que facilita a depuração.
+
+        Os resultados são entregues à medida que ficam prontos, para que possam ser
+        gravados sem acumular a lista inteira em memória.
+
+        Args:
+            func (callable): Função de enriquecimento de um recurso.
+            items (list): Recursos listados.
+        return:
+            generator: Resultados na mesma ordem de `items`.
+        """
+        if self.max_workers <= 1:
+            yield from (func(item) for item in items)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(func, items)
+
+    def count_job_runs(
+            self,
+            client: boto3.client,
+            job_name: str,
+            job_state: dict = None
         ):
-        
-        client = self.session.client('glue')
-        service = 'GLUE'
-        service = service.upper()
+        """
+        Conta as execuções de um job Glue lendo apenas as páginas de `get_job_runs`
+        mais recentes que a marca d'água salva na última execução.
 
-        verify = []
-        next_token = None
+        Args:
+            client (boto3.client): Cliente do Glue.
+            job_name (str): Nome do job.
+            job_state (dict): Estado salvo do job (`last_run_id`, `last_started_on`, `total_executions`).
+                Quando vazio, todas as páginas são lidas (recontagem completa).
+        return:
+            tuple: Total de execuções, última execução e o novo estado do job.
+        """
+
+        job_state = job_state or {}
+        watermark_id = job_state.get('last_run_id')
+        watermark_started_on = job_state.get('last_started_on')
+
+        new_executions = 0
+        next_token_jr = None
+        last_execution = None
+        reached_watermark = False
 
         while True:
-            if next_token:
-                response = client.get_jobs(
-                    nextToken=next_token
+            if next_token_jr:
+                job_runs = client.get_job_runs(
+                    JobName=job_name,
+                    NextToken=next_token_jr
                     )
             else:
-                response = client.get_jobs()
+                job_runs = client.get_job_runs(
+                    JobName=job_name
+                    )
 
-            for job in response['Jobs']:
-                job_name = job['Name']
-                connections = job['Connections']['Connections'] if job.get('Connections') else []
+            for job_run in job_runs['JobRuns']:
+                started_on = job_run['StartedOn'].isoformat()
+                if job_run['Id'] == watermark_id or (watermark_started_on and started_on < watermark_started_on):
+                    reached_watermark = True
+                    break
 
-                creation_date = str(job['CreatedOn'].strftime('%Y-%m-%d'))
-                created_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(creation_date, '%Y-%m-%d')).days
-                worker_type = job.get('WorkerType', 'N/A')
-                number_of_workers = job.get('NumberOfWorkers', 'N/A')
-                glue_version = job.get('GlueVersion', 'N/A')
-                resource_type = f"{worker_type} - {number_of_workers} DPUS - {glue_version}"
+                new_executions += 1
+                if last_execution is None:
+                    last_execution = job_run
 
-                total_executions = 0
-                next_token_jr = None
-                last_execution = None
+            next_token_jr = job_runs.get('NextToken')
+            if reached_watermark or not next_token_jr:
+                break
 
-                while True:
-                    if next_token_jr:
-                        job_runs = client.get_job_runs(
-                            JobName=job_name,
-                            NextToken=next_token_jr
-                            )
-                    else:
-                        job_runs = client.get_job_runs(
-                            JobName=job_name
-                            )
-                    
-                    total_executions += len(job_runs['JobRuns'])
+        total_executions = job_state.get('total_executions', 0) + new_executions
+
+        if last_execution:
+            new_state = {
+                'last_run_id': last_execution['Id'],
+                'last_started_on': last_execution['StartedOn'].isoformat(),
+                'total_executions': total_executions
+            }
+        else:
+            new_state = dict(job_state, total_executions=total_executions)
+            if new_state.get('last_started_on'):
+                last_execution = {'StartedOn': datetime.datetime.fromisoformat(new_state['last_started_on'])}
 
-                    if job_runs['JobRuns'] and last_execution is None:
-                        last_execution = job_runs['JobRuns'][0]
+        return total_executions, last_execution, new_state
 
-                    next_token_jr = job_runs.get('NextToken')
-                    if not next_token_jr:
-                        break
-                
-                if last_execution:
-                    last_execution = job_runs['JobRuns'][0]
-                    last_execution_date = str(last_execution['StartedOn'].strftime('%Y-%m-%d'))
-                    execution_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(last_execution_date, '%Y-%m-%d')).days
-                
+    def monitor_glue(
+            self,
+            full_recount: bool = False,
+            collect: bool = False
+        ):
+        """
+        Monitora os jobs Glue da conta.
+
+        Args:
+            full_recount (bool): Ignora o estado salvo e reconta todas as execuções dos jobs.
+            collect (bool): Mantém os registros em memória para retorná-los. Caso contrário,
+                eles são apenas gravados na tabela de controle à medida que são classificados.
+        return:
+            list: Registros classificados quando `collect` é verdadeiro, senão None.
+        """
+        
+        client = self.client('glue')
+        service = 'GLUE'
+        service = service.upper()
+
+        state = {} if full_recount else self.state_store.load(service)
+        new_state = {}
+
+        with self.metrics.phase(service, 'list'):
+            self.lifecycle_manager.prefetch_tags(f'{service}_MONITORING')
+
+            jobs = []
+            next_token = None
+
+            while True:
+                if next_token:
+                    response = client.get_jobs(
+                        nextToken=next_token
+                        )
                 else:
-                    last_execution_date = creation_date
-                    execution_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(creation_date, '%Y-%m-%d')).days
+                    response = client.get_jobs()
+
+                jobs.extend(response['Jobs'])
+
+                next_token = response.get('NextToken')
+                if not next_token:
+                    break
+
+        def enrich_job(job: dict):
+            job_name = job['Name']
+            connections = job['Connections']['Connections'] if job.get('Connections') else []
+
+            creation_date = str(job['CreatedOn'].strftime('%Y-%m-%d'))
+            created_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(creation_date, '%Y-%m-%d')).days
+            worker_type = job.get('WorkerType', 'N/A')
+            number_of_workers = job.get('NumberOfWorkers', 'N/A')
+            glue_version = job.get('GlueVersion', 'N/A')
+            resource_type = f"{worker_type} - {number_of_workers} DPUS - {glue_version}"
+
+            total_executions, last_execution, job_state = self.count_job_runs(
+                client=client,
+                job_name=job_name,
+                job_state=state.get(job_name)
+            )
+            
+            if last_execution:
+                last_execution_date = str(last_execution['StartedOn'].strftime('%Y-%m-%d'))
+                execution_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(last_execution_date, '%Y-%m-%d')).days
+            
+            else:
+                last_execution_date = creation_date
+                execution_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(creation_date, '%Y-%m-%d')).days
 
+            with self.metrics.timer(service, 'classify'):
                 resource_class, status, reason, retention_days, type_of_management = self.lifecycle_manager.verify_lifecycle(
                     monitoring=f'{service}_MONITORING',
                     client=client,
@@ -411,94 +1905,120 @@ class Rosie:
 
                 status, reason = self.lifecycle_manager.verify_legacy(status, reason)
 
-                print(f"Tipo: {resource_type}")
-
-                verify_item = {
-                    'nome_recurso': job_name,
-                    'tipo_gerenciamento': type_of_management,
-                    'classe_recurso': resource_class,
-                    'servico': service,
-                    'status': status,
-                    'motivo': reason,
-                    'dt_criacao': creation_date,
-                    'dias_criacao': created_in,
-                    'dt_ultima_atualizacao': last_execution_date,
-                    'dias_ultima_atualizacao': execution_in,
-                    'qtd_execucoes': total_executions,
-                    'tipo_recurso': resource_type,
-                    'dt_status': self.date_status,
-                }
-
-                verify.append(verify_item)
-
-            next_token = response.get('NextToken')
-            if not next_token:
-                break
+            print(f"Tipo: {resource_type}")
+
+            verify_item = {
+                'nome_recurso': job_name,
+                'tipo_gerenciamento': type_of_management,
+                'classe_recurso': resource_class,
+                'servico': service,
+                'status': status,
+                'motivo': reason,
+                'dt_criacao': creation_date,
+                'dias_criacao': created_in,
+                'dt_ultima_atualizacao': last_execution_date,
+                'dias_ultima_atualizacao': execution_in,
+                'qtd_execucoes': total_executions,
+                'tipo_recurso': resource_type,
+                'dt_status': self.date_status,
+            }
+
+            return verify_item, job_state
 
-        self.table_monitor.save_result(verify_list=verify, service=service)
-        self.table_monitor.create_partition(service=service)
+        verify = [] if collect else None
+        with self.table_monitor.result_writer(service) as writer:
+            with self.metrics.phase(service, 'enrich'):
+                for job, (verify_item, job_state) in zip(jobs, self.enrich(enrich_job, jobs)):
+                    writer.write(verify_item)
+                    new_state[job['Name']] = job_state
+                    if collect:
+                        verify.append(verify_item)
+
+        with self.metrics.phase(service, 'write'):
+            self.table_monitor.create_partition(service=service)
+            self.state_store.save(service, new_state)
+
+        return verify
 
     def monitor_sfn(
-            self
+            self,
+            collect: bool = False
         ):
-        
-        client = self.session.client('stepfunctions')
-        glue_client = self.session.client('glue')
+        """
+        Monitora as state machines do Step Functions da conta.
+
+        Args:
+            collect (bool): Mantém os registros em memória para retorná-los (ver `monitor_glue`).
+        return:
+            list: Registros classificados quando `collect` é verdadeiro, senão None.
+        """
+
+        client = self.client('stepfunctions')
         service = 'STEP_FUNCTIONS'
         service = service.upper()
 
-        verify = []
-        next_token = None
+        with self.metrics.phase(service, 'list'):
+            self.lifecycle_manager.prefetch_tags(f'{service}_MONITORING')
 
-        while True:
-            if next_token:
-                response = client.list_state_machines(
-                    nextToken=next_token
-                    )
-            else:
-                response = client.list_state_machines()
+            state_machines = []
+            next_token = None
+
+            while True:
+                if next_token:
+                    response = client.list_state_machines(
+                        nextToken=next_token
+                        )
+                else:
+                    response = client.list_state_machines()
 
-            for state_machine in response['stateMachines']:
-                state_machine_name = state_machine['name']
-                state_machine_arn = state_machine['stateMachineArn']
+                state_machines.extend(response['stateMachines'])
 
-                creation_date = str(state_machine['creationDate'].strftime('%Y-%m-%d'))
-                created_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(creation_date, '%Y-%m-%d')).days
-                resource_type = state_machine['type']
+                next_token = response.get('nextToken')
+                if not next_token:
+                    break
 
-                total_executions = 0
-                next_token_sm = None
-                last_execution = None
+        def enrich_state_machine(state_machine: dict):
+            state_machine_name = state_machine['name']
+            state_machine_arn = state_machine['stateMachineArn']
 
-                while True:
-                    if next_token_sm:
-                        executions = client.list_executions(
-                            stateMachineArn=state_machine_arn,
-                            nextToken=next_token_sm
-                            )
-                    else:
-                        executions = client.list_executions(
-                            stateMachineArn=state_machine_arn
-                            )
-                    
-                    total_executions += len(executions['executions'])
+            creation_date = str(state_machine['creationDate'].strftime('%Y-%m-%d'))
+            created_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(creation_date, '%Y-%m-%d')).days
+            resource_type = state_machine['type']
 
-                    if executions['executions'] and last_execution is None:
-                        last_execution = executions['executions'][0]
+            total_executions = 0
+            next_token_sm = None
+            last_execution = None
 
-                    next_token_sm = executions.get('nextToken')
-                    if not next_token_sm:
-                        break
+            while True:
+                if next_token_sm:
+                    executions = client.list_executions(
+                        stateMachineArn=state_machine_arn,
+                        nextToken=next_token_sm
+                        )
+                else:
+                    executions = client.list_executions(
+                        stateMachineArn=state_machine_arn
+                        )
+                
+                total_executions += len(executions['executions'])
 
-                if last_execution:
+                if executions['executions'] and last_execution is None:
                     last_execution = executions['executions'][0]
-                    last_execution_date = str(last_execution['startDate'].strftime('%Y-%m-%d'))
-                    execution_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(last_execution_date, '%Y-%m-%d')).days
 
-                else:
-                    last_execution_date = creation_date
-                    execution_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(creation_date, '%Y-%m-%d')).days
+                next_token_sm = executions.get('nextToken')
+                if not next_token_sm:
+                    break
+
+            if last_execution:
+                last_execution = executions['executions'][0]
+                last_execution_date = str(last_execution['startDate'].strftime('%Y-%m-%d'))
+                execution_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(last_execution_date, '%Y-%m-%d')).days
 
+            else:
+                last_execution_date = creation_date
+                execution_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(creation_date, '%Y-%m-%d')).days
+
+            with self.metrics.timer(service, 'classify'):
                 resource_class, status, reason, retention_days, type_of_management = self.lifecycle_manager.verify_lifecycle(
                     monitoring=f'{service}_MONITORING',
                     client=client,
@@ -509,190 +2029,255 @@ class Rosie:
 
                 status, reason = self.lifecycle_manager.verify_legacy(status, reason)
 
-                verify_item = {
-                    'nome_recurso': state_machine_name,
-                    'tipo_gerenciamento': type_of_management,
-                    'classe_recurso': resource_class,
-                    'servico': service,
-                    'status': status,
-                    'motivo': reason,
-                    'dt_criacao': creation_date,
-                    'dias_criacao': created_in,
-                    'dt_ultima_atualizacao': last_execution_date,
-                    'dias_ultima_atualizacao': execution_in,
-                    'qtd_execucoes': total_executions,
-                    'tipo_recurso': resource_type,
-                    'dt_status': self.date_status,
-                }
-
-                verify.append(verify_item)
-
-            next_token = response.get('nextToken')
-            if not next_token:
-                break
+            return {
+                'nome_recurso': state_machine_name,
+                'tipo_gerenciamento': type_of_management,
+                'classe_recurso': resource_class,
+                'servico': service,
+                'status': status,
+                'motivo': reason,
+                'dt_criacao': creation_date,
+                'dias_criacao': created_in,
+                'dt_ultima_atualizacao': last_execution_date,
+                'dias_ultima_atualizacao': execution_in,
+                'qtd_execucoes': total_executions,
+                'tipo_recurso': resource_type,
+                'dt_status': self.date_status,
+            }
 
-        self.table_monitor.save_result(verify_list=verify, service=service)
-        self.table_monitor.create_partition(service=service)
+        verify = [] if collect else None
+        with self.table_monitor.result_writer(service) as writer:
+            with self.metrics.phase(service, 'enrich'):
+                for verify_item in self.enrich(enrich_state_machine, state_machines):
+                    writer.write(verify_item)
+                    if collect:
+                        verify.append(verify_item)
+
+        with self.metrics.phase(service, 'write'):
+            self.table_monitor.create_partition(service=service)
+
+        return verify
 
     def monitor_s3(
             self,
-            buckets: list = [{'bucket': 'itau-self-wkp-us-east-1-197045787308', 'prefixes': ['', 'dados/'], 'objectNotDelete': ['dados/']}]
+            buckets: list = [{'bucket': 'itau-self-wkp-us-east-1-197045787308', 'prefixes': ['', 'dados/'], 'objectNotDelete': ['dados/']}],
+            source: str = None,
+            collect: bool = False
         ):
+        """
+        Monitora as pastas e objetos dos buckets S3 configurados.
+
+        A listagem de cada prefixo é paginada até o fim e cada pasta/objeto encontrado
+        é agregado e classificado em um pool de threads por bucket, limitado por
+        `maxWorkers` no item do bucket ou por `S3_MAX_WORKERS_PER_BUCKET` no config.
+        Os buckets são processados em paralelo entre si.
+
+        Args:
+            buckets (list): Buckets, prefixos monitorados e objetos que não devem ser deletados.
+                O item pode informar `inventory` com o caminho S3 da configuração do S3 Inventory.
+            source (str): `API` ou `INVENTORY`. Quando omitido, usa `S3_SOURCE` do config (padrão `API`).
+                No modo `INVENTORY`, buckets sem `inventory` continuam sendo listados via API.
+            collect (bool): Mantém os registros em memória para retorná-los (ver `monitor_glue`).
+        return:
+            list: Registros classificados quando `collect` é verdadeiro, senão None.
+        """
         
-        client = self.session.client('s3')
         service = 'S3'
         service = service.upper()
+        source = (source or self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME'].get('S3_SOURCE', 'API')).upper()
+        per_bucket_workers = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME'].get('S3_MAX_WORKERS_PER_BUCKET', self.max_workers)
+        client = self.client('s3', max_pool_connections=max(per_bucket_workers * len(buckets), 10))
+
+        def classify_object(bucket: dict, prefix: str, typeOfObject: str, obj: str, stats: dict = None):
+            if '/' in obj:
+                if obj.split('/')[-1:] == ['']:
+                    sub_name = obj.split('/')[-2]
+                else:
+                    sub_name = obj.split('/')[-1]
+            else:
+                sub_name = obj
 
-        verify = []
-        
-        for bucket in buckets:
-            for prefix in bucket['prefixes']:
-                temp_list = [{'folder': []}, {'file': []}]
-                response = client.list_objects(
-                    Bucket=bucket['bucket'],
-                    Prefix=prefix,
-                    Delimiter='/'
-                )
-                if response.get('CommonPrefixes') is not None:
-                    for item in response.get('CommonPrefixes'):
-                        if len(prefix.split('/')) > 2:
-                            pref = item['Prefix']
-                        else:
-                            pref = item.get('Prefix')
-                        
-                        if not pref in bucket['objectNotDelete'] and not pref in bucket['prefixes']:
-                            if pref not in temp_list[0]['folder']:
-                                temp_list[0]['folder'].append(pref)
-                            else:
-                                print(f'Pasta {pref} já foi adicionada')
-                                continue
-                
-                if 'Contents' in response:
-                    for item in response['Contents']:
-                        if len(prefix.split('/')) > 2:
-                            pref = item['Key']
-                        else:
-                            pref = item.get('Key')
-                    
-                        if not pref in bucket['objectNotDelete'] and not pref in bucket['prefixes']:
-                            if pref not in temp_list[1]['file']:
-                                temp_list[1]['file'].append(pref)
-                            else:
-                                print(f'Arquivo {pref} já foi adicionado')
-                                continue
-                
-                for item in temp_list:
-                    typeOfObject = list(item.keys())[0]
-                    objects = list(item.values())[0]
-
-                    for obj in objects:
-                        if '/' in obj:
-                            if obj.split('/')[-1:] == ['']:
-                                sub_name = obj.split('/')[-2]
-                            else:
-                                sub_name = obj.split('/')[-1]
-                        else:
-                            sub_name = obj
-
-                        creation_date, last_put_data_object = self.rosie_utils.creation_date_s3(
-                            client=client, 
-                            bucket=bucket['bucket'], 
-                            folder=obj
-                            )
-                        created_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(creation_date, '%Y-%m-%d')).days
-                        updated_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(last_put_data_object, '%Y-%m-%d')).days
-                        size = self.rosie_utils.get_size_s3(client=client, bucket=bucket['bucket'], folder=obj)
-
-                        if typeOfObject == 'folder' and (prefix in bucket['prefixes'] and prefix != ''):
-                            resource_class, status, reason, retention_days, type_of_management = self.lifecycle_manager.verify_lifecycle(
-                                monitoring=f'{service}_MONITORING',
-                                client=client,
-                                resource_name=sub_name,
-                                creation_date=creation_date,
-                                last_execution_date=creation_date
-                            )
+            if stats is None:
+                stats = self.rosie_utils.get_prefix_stats(
+                    client=client, 
+                    bucket=bucket['bucket'], 
+                    folder=obj
+                    )
+            creation_date = stats['min_last_modified']
+            last_put_data_object = stats['max_last_modified']
+            created_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(creation_date, '%Y-%m-%d')).days
+            updated_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(last_put_data_object, '%Y-%m-%d')).days
+            size = self.rosie_utils.format_size(stats['size_bytes'])
+
+            if typeOfObject == 'folder' and (prefix in bucket['prefixes'] and prefix != ''):
+                with self.metrics.timer(service, 'classify'):
+                    resource_class, status, reason, retention_days, type_of_management = self.lifecycle_manager.verify_lifecycle(
+                        monitoring=f'{service}_MONITORING',
+                        client=client,
+                        resource_name=sub_name,
+                        creation_date=creation_date,
+                        last_execution_date=creation_date
+                    )
 
-                        elif sub_name == 'ROSIE':
-                            resource_class = 'ROSIE'
-                            status = 'ignore'
-                            reason = 'IGNORE - Recurso de monitoramento da ROSIE.'
-                            retention_days = None
-                            type_of_management = 'ROSIE'
-                        else:
-                            resource_class = 'N/A'
-                            status = 'delete'
-                            reason = 'DELETE - Objeto fora do diretório de monitoramento.'
-                            retention_days = None
-                            type_of_management = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['MONITORING'][f'{service}_MONITORING']['LIFECYCLE']['TYPE_OF_MANAGEMENT']
+            elif sub_name == 'ROSIE':
+                resource_class = 'ROSIE'
+                status = 'ignore'
+                reason = 'IGNORE - Recurso de monitoramento da ROSIE.'
+                retention_days = None
+                type_of_management = 'ROSIE'
+            else:
+                resource_class = 'N/A'
+                status = 'delete'
+                reason = 'DELETE - Objeto fora do diretório de monitoramento.'
+                retention_days = None
+                type_of_management = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['MONITORING'][f'{service}_MONITORING']['LIFECYCLE']['TYPE_OF_MANAGEMENT']
+
+            status, reason = self.lifecycle_manager.verify_legacy(status, reason)
+
+            return {
+                'nome_recurso': f's3://{bucket["bucket"]}/{obj}',
+                'tipo_gerenciamento': type_of_management,
+                'classe_recurso': resource_class,
+                'servico': service,
+                'status': status,
+                'motivo': reason,
+                'dt_criacao': creation_date,
+                'dias_criacao': created_in,
+                'dt_ultima_atualizacao': last_put_data_object,
+                'dias_ultima_atualizacao': updated_in,
+                'tamanho': size,
+                'dt_status': self.date_status
+            }
 
-                        status, reason = self.lifecycle_manager.verify_legacy(status, reason)
+        verify = [] if collect else None
+        lock = threading.Lock()
 
-                        verify_item = {
-                            'nome_recurso': f's3://{bucket["bucket"]}/{obj}',
-                            'tipo_gerenciamento': type_of_management,
-                            'classe_recurso': resource_class,
-                            'servico': service,
-                            'status': status,
-                            'motivo': reason,
-                            'dt_criacao': creation_date,
-                            'dias_criacao': created_in,
-                            'dt_ultima_atualizacao': last_put_data_object,
-                            'dias_ultima_atualizacao': updated_in,
-                            'tamanho': size,
-                            'dt_status': self.date_status
-                        }
+        def classify_and_write(writer: RosieParquetWriter, *args):
+            verify_item = classify_object(*args)
+            writer.write(verify_item)
+            if collect:
+                with lock:
+                    verify.append(verify_item)
 
-                        verify.append(verify_item)
+        def monitor_bucket(bucket: dict, writer: RosieParquetWriter):
+            futures = []
 
-        self.table_monitor.save_result(verify_list=verify, service=service)
-        self.table_monitor.create_partition(service=service)
+            if source == 'INVENTORY' and bucket.get('inventory'):
+                inventory_entries = self.inventory.aggregate_prefixes(client, bucket['inventory'], bucket['prefixes'])
+
+            with ThreadPoolExecutor(max_workers=bucket.get('maxWorkers', per_bucket_workers)) as executor:
+                for prefix in bucket['prefixes']:
+                    if source == 'INVENTORY' and bucket.get('inventory'):
+                        entries = inventory_entries[prefix]
+                    else:
+                        entries = ((typeOfObject, obj, None) for typeOfObject, obj in self.rosie_utils.list_prefix(client=client, bucket=bucket['bucket'], prefix=prefix))
+
+                    seen = set()
+                    for typeOfObject, obj, stats in entries:
+                        if obj in bucket['objectNotDelete'] or obj in bucket['prefixes']:
+                            continue
+                        if obj in seen:
+                            print(f'Objeto {obj} já foi adicionado')
+                            continue
+                        seen.add(obj)
+                        futures.append(executor.submit(classify_and_write, writer, bucket, prefix, typeOfObject, obj, stats))
+
+                for future in futures:
+                    future.result()
+
+        with self.table_monitor.result_writer(service) as writer:
+            with self.metrics.phase(service, 'enrich'):
+                for _ in self.enrich(lambda bucket: monitor_bucket(bucket, writer), buckets):
+                    pass
+
+        with self.metrics.phase(service, 'write'):
+            self.table_monitor.create_partition(service=service)
+
+        return verify
 
     def monitor_data_catalog(
             self,
             databases: list = ['workspace_db'],
-            buckets: list = [{'bucket': 'itau-self-wkp-us-east-1-197045787308', 'prefixes': ['', 'dados/'], 'objectNotDelete': ['dados/']}]
+            buckets: list = [{'bucket': 'itau-self-wkp-us-east-1-197045787308', 'prefixes': ['', 'dados/'], 'objectNotDelete': ['dados/']}],
+            source: str = None,
+            collect: bool = False
         ):
+        """
+        Monitora as tabelas do Glue Data Catalog e o tamanho dos dados em suas localizações.
+
+        Args:
+            databases (list): Databases monitorados.
+            buckets (list): Buckets das localizações das tabelas, com `inventory` opcional (ver `monitor_s3`).
+            source (str): `API` ou `INVENTORY`. Quando omitido, usa `S3_SOURCE` do config (padrão `API`).
+            collect (bool): Mantém os registros em memória para retorná-los (ver `monitor_glue`).
+        return:
+            list: Registros classificados quando `collect` é verdadeiro, senão None.
+        """
         
-        s3_client = self.session.client('s3')
-        glue_client = self.session.client('glue')
+        s3_client = self.client('s3')
+        glue_client = self.client('glue')
         service = 'DATA_CATALOG'
-        verify = []
+        source = (source or self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME'].get('S3_SOURCE', 'API')).upper()
+        inventories = {bucket['bucket']: bucket['inventory'] for bucket in buckets if bucket.get('inventory')}
+        tables = []
         next_token = None
 
-        for database in databases:
-            while True:
-                if next_token:
-                    response = glue_client.get_tables(
-                        DatabaseName=database,
-                        NextToken=next_token
-                        )
-                else:
-                    response = glue_client.get_tables(
-                        DatabaseName=database
-                        )
+        with self.metrics.phase(service, 'list'):
+            for database in databases:
+                while True:
+                    if next_token:
+                        response = glue_client.get_tables(
+                            DatabaseName=database,
+                            NextToken=next_token
+                            )
+                    else:
+                        response = glue_client.get_tables(
+                            DatabaseName=database
+                            )
                 
-                for table in response['TableList']:
-                    path_location = table['StorageDescriptor']['Location'] if 'StorageDescriptor' in table and 'Location' in table['StorageDescriptor'] else ''
-                    table_name = table['Name']
+                    for table in response['TableList']:
+                        path_location = table['StorageDescriptor']['Location'] if 'StorageDescriptor' in table and 'Location' in table['StorageDescriptor'] else ''
+                        creation_date = str(table['CreateTime'].strftime('%Y-%m-%d'))
+                        last_updated = str(table['UpdateTime'].strftime('%Y-%m-%d'))
+                        tables.append((database, table['Name'], path_location, creation_date, last_updated))
+
+                    next_token = response.get('NextToken')
+                    if not next_token:
+                        break
+
+        with self.metrics.phase(service, 'enrich'):
+            locations = {}
+            for database, table_name, path_location, creation_date, last_updated in tables:
+                locations.setdefault(path_location.split('/')[2], set()).add('/'.join(path_location.split('/')[3:]))
 
-                    creation_date = str(table['CreateTime'].strftime('%Y-%m-%d'))
+            sizes = {}
+            for bucket_name, folders in locations.items():
+                if source == 'INVENTORY' and bucket_name in inventories:
+                    stats = self.inventory.get_folder_stats(s3_client, inventories[bucket_name], folders)
+                    sizes[bucket_name] = {folder: folder_stats['size_bytes'] for folder, folder_stats in stats.items()}
+                else:
+                    sizes[bucket_name] = self.rosie_utils.get_prefix_sizes(client=s3_client, bucket=bucket_name, folders=list(folders))
+
+        verify = [] if collect else None
+        with self.table_monitor.result_writer(service) as writer:
+            with self.metrics.phase(service, 'classify'):
+                for database, table_name, path_location, creation_date, last_updated in tables:
                     created_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(creation_date, '%Y-%m-%d')).days
-                    last_updated = str(table['UpdateTime'].strftime('%Y-%m-%d'))
                     updated_in = (datetime.datetime.strptime(self.date_status, '%Y-%m-%d') - datetime.datetime.strptime(last_updated, '%Y-%m-%d')).days
 
-                    resource_class, status, reason, retention_days, type_of_management = self.lifecycle_manager.verify_lifecycle(
-                        monitoring=f'{service}_MONITORING',
-                        client=glue_client,
-                        resource_name=table_name,
-                        creation_date=creation_date,
-                        last_execution_date=last_updated
-                    )
+                    with self.metrics.timer(service, 'classify'):
+                        resource_class, status, reason, retention_days, type_of_management = self.lifecycle_manager.verify_lifecycle(
+                            monitoring=f'{service}_MONITORING',
+                            client=glue_client,
+                            resource_name=table_name,
+                            creation_date=creation_date,
+                            last_execution_date=last_updated
+                        )
 
-                    status, reason = self.lifecycle_manager.verify_legacy(status, reason)
+                        status, reason = self.lifecycle_manager.verify_legacy(status, reason)
 
                     bucket_name = path_location.split('/')[2]
                     obj = '/'.join(path_location.split('/')[3:])
-                    size = self.rosie_utils.get_size_s3(client=s3_client, bucket=bucket_name, folder=obj)
 
                     verify_item = {
                         'nome_recurso': path_location,
@@ -707,39 +2292,466 @@ class Rosie:
                         'dias_criacao': created_in,
                         'dt_ultima_atualizacao': last_updated,
                         'dias_ultima_atualizacao': updated_in,
-                        'tamanho': size,
+                        'tamanho': self.rosie_utils.format_size(sizes[bucket_name][obj]),
                         'dt_status': self.date_status,
                     }
 
-                    verify.append(verify_item)
+                    writer.write(verify_item)
+                    if collect:
+                        verify.append(verify_item)
 
-                next_token = response.get('NextToken')
-                if not next_token:
-                    break
+        with self.metrics.phase(service, 'write'):
+            self.table_monitor.create_partition(service=service)
 
-        self.table_monitor.save_result(verify_list=verify, service=service)
-        self.table_monitor.create_partition(service=service)
+        return verify
 
-class RosieCleaner:
-    """
-    Classe para limpeza de recursos monitorados pela ROSIE.
+    def run_monitors(self, monitors: dict, collect: bool = False) -> dict:
+        """
+        Executa vários monitoramentos em paralelo no mesmo processo, compartilhando a
+        sessão, o config e os caches. Cada monitoramento grava seu Parquet à medida que
+        classifica os recursos, as demais gravações ficam em uma única thread de segundo
+        plano e as partições são registradas em lote ao final, também em segundo plano
+        quando `background_writes` já está ativo (modo combinado). Se um monitoramento
+        falhar, as partições pendentes não são registradas e o erro é propagado.
+
+        Args:
+            monitors (dict): Serviço e argumentos do respectivo `monitor_*`
+                (ex: {'GLUE': {}, 'S3': {'buckets': [...]}}).
+            collect (bool): Mantém os registros de cada serviço em memória para retorná-los.
+        return:
+            dict: Registros classificados de cada serviço quando `collect` é verdadeiro.
+        """
+        methods = {
+            'GLUE': self.monitor_glue,
+            'STEP_FUNCTIONS': self.monitor_sfn,
+            'S3': self.monitor_s3,
+            'DATA_CATALOG': self.monitor_data_catalog,
+        }
+
+        background = self.table_monitor.background_writes
+        self.table_monitor.background_writes = True
+        self.table_monitor.defer_partitions = True
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(len(monitors), 1)) as executor:
+                futures = {service: executor.submit(methods[service], collect=collect, **kwargs) for service, kwargs in monitors.items()}
+
+            results = {service: future.result() for service, future in futures.items()}
+        except BaseException:
+            # As partições pendentes são descartadas (e não registradas) para não mascarar o erro
+            # original nem vazar para o próximo `flush_partitions` deste RosieTableMonitor
+            self.table_monitor.defer_partitions = False
+            with self.table_monitor.lock:
+                self.table_monitor.pending_partitions = []
+            if not background:
+                self.table_monitor.background_writes = False
+            raise
+
+        self.table_monitor.defer_partitions = False
+        self.table_monitor.submit(self.table_monitor.flush_partitions)
+        if not background:
+            self.table_monitor.background_writes = False
+            self.table_monitor.wait()
+
+        return results
+
+    def monitor_and_clean(self, monitors: dict, cleaner=None):
+        """
+        Modo combinado: executa os monitoramentos e entrega os registros classificados
+        direto ao `RosieCleaner`, sem passar pelo Parquet, pela partição e pelo Athena.
+        Os Parquet de cada monitoramento continuam sendo gravados para auditoria; é o único
+        modo em que os registros são mantidos em memória.
+
+        Args:
+            monitors (dict): Serviço e argumentos do respectivo `monitor_*`
+                (ex: {'GLUE': {}, 'S3': {'buckets': [...]}}).
+            cleaner (RosieCleaner): Cleaner a ser usado. Quando omitido, um novo é criado com a mesma fábrica de clientes e config.
+        """
+        cleaner = cleaner or RosieCleaner(self.config, client_factory=self.client_factory, partition_date=self.date_status)
+        self.table_monitor.background_writes = True
+
+        try:
+            verify = []
+            for service_verify in self.run_monitors(monitors, collect=True).values():
+                verify.extend(service_verify)
+
+            cleaner.clean(services=list(monitors), resource_list=verify)
+        finally:
+            self.table_monitor.background_writes = False
+            self.table_monitor.wait()
+
+class RosieS3Mover:
+    """
+    Cópia e deleção em massa de prefixos do S3 para o backup e a limpeza da ROSIE.
+
+    A listagem é consumida página a página: as cópias de cada página rodam em paralelo
+    (cópia gerenciada multipart para objetos acima de `multipart_threshold`) e as
+    deleções usam `delete_objects` em lotes de 1000 chaves. Assim como
+    `objects.filter().delete()`, apenas as versões atuais são deletadas: em buckets
+    versionados o S3 cria delete markers e as versões anteriores são preservadas.
+
+    Attributes:
+        client (boto3.client): Cliente do S3.
+        max_workers (int): Quantidade máxima de cópias simultâneas.
+        multipart_threshold (int): Tamanho, em bytes, a partir do qual a cópia é multipart.
+        purge_versions (bool): Remove permanentemente todas as versões e delete markers do
+            prefixo em buckets versionados (`CLEANER_PURGE_VERSIONS` no config). Padrão: False.
+    """
+    def __init__(self, client: boto3.client, max_workers: int = 16, multipart_threshold: int = 512 * 1024 * 1024, purge_versions: bool = False):
+        from boto3.s3.transfer import TransferConfig
+
+        self.client = client
+        self.max_workers = max_workers
+        self.multipart_threshold = multipart_threshold
+        self.purge_versions = purge_versions
+        self.transfer_config = TransferConfig(multipart_threshold=multipart_threshold, max_concurrency=4)
+        self.versioned = {}
+
+    def is_versioned(self, bucket: str) -> bool:
+        if bucket not in self.versioned:
+            status = self.client.get_bucket_versioning(Bucket=bucket).get('Status')
+            self.versioned[bucket] = status in ['Enabled', 'Suspended']
+
+        return self.versioned[bucket]
+
+    def copy_object(self, source_bucket: str, file: dict, dest_bucket: str, dest_key: str):
+        copy_source = {
+            'Bucket': source_bucket,
+            'Key': file['Key']
+        }
+        if file['Size'] >= self.multipart_threshold:
+            self.client.copy(copy_source, dest_bucket, dest_key, Config=self.transfer_config)
+        else:
+            self.client.copy_object(
+                Bucket=dest_bucket,
+                CopySource=copy_source,
+                Key=dest_key
+            )
+
+    def copy_prefix(self, source_bucket: str, prefix: str, dest_bucket: str, dest_prefix: str) -> list:
+        """
+        Copia todos os objetos de um prefixo para `dest_prefix` + chave original.
+
+        Args:
+            source_bucket (str): Bucket de origem.
+            prefix (str): Prefixo de origem.
+            dest_bucket (str): Bucket de destino.
+            dest_prefix (str): Prefixo adicionado às chaves no destino.
+        return:
+            list: Falhas no formato {'Key', 'Error'}.
+        """
+        failures = []
+
+        def copy(file: dict):
+            try:
+                self.copy_object(source_bucket, file, dest_bucket, f'{dest_prefix}{file["Key"]}')
+            except Exception as e:
+                return {'Key': file['Key'], 'Error': str(e)}
+
+        paginator = self.client.get_paginator('list_objects_v2')
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for response in paginator.paginate(Bucket=source_bucket, Prefix=prefix):
+                for failure in executor.map(copy, response.get('Contents', [])):
+                    if failure:
+                        failures.append(failure)
+
+        return failures
+
+    def delete_prefix(self, bucket: str, prefix: str) -> list:
+        """
+        Deleta todos os objetos de um prefixo em lotes de até 1000 chaves, relistando
+        o início do prefixo após cada lote. Apenas as versões atuais são deletadas, exceto
+        com `purge_versions`, que remove todas as versões e delete markers em buckets
+        versionados. A deleção é interrompida no primeiro lote com falhas.
+
+        Args:
+            bucket (str): Bucket.
+            prefix (str): Prefixo a ser deletado.
+        return:
+            list: Falhas no formato {'Key', 'Error'}.
+        """
+        failures = []
+        versioned = self.purge_versions and self.is_versioned(bucket)
+
+        while True:
+            if versioned:
+                response = self.client.list_object_versions(Bucket=bucket, Prefix=prefix, MaxKeys=1000)
+                objects = [{'Key': item['Key'], 'VersionId': item['VersionId']} for item in response.get('Versions', []) + response.get('DeleteMarkers', [])]
+            else:
+                response = self.client.list_objects_v2(Bucket=bucket, Prefix=prefix, MaxKeys=1000)
+                objects = [{'Key': item['Key']} for item in response.get('Contents', [])]
+
+            if not objects:
+                break
+
+            batch_failures = self.delete_batch(bucket, objects)
+            if batch_failures:
+                failures.extend(batch_failures)
+                break
+
+        return failures
+
+    def delete_batch(self, bucket: str, objects: list) -> list:
+        response = self.client.delete_objects(
+            Bucket=bucket,
+            Delete={
+                'Objects': objects,
+                'Quiet': True
+            }
+        )
+
+        return [{'Key': error['Key'], 'Error': f"{error.get('Code')}: {error.get('Message')}"} for error in response.get('Errors', [])]
+
+class RosieCleanerJournal:
+    """
+    Diário de progresso do cleaner no bucket da ROSIE. Cada etapa concluída de um recurso
+    (`backup`, `delete`, ...) é gravada como um objeto próprio em
+    `ROSIE/journal/CLEANER/{data da partição}/{etapa}/`, sem sobrescrever entradas anteriores,
+    para que uma execução interrompida possa ser retomada pulando o que já foi feito, mesmo
+    que a retomada aconteça em outro dia.
+
+    Attributes:
+        client (boto3.client): Cliente S3.
+        bucket (str): Bucket da ROSIE.
+        partition_date (str): Data da partição dos monitoramentos sendo limpa (YYYY-MM-DD).
+    """
+    def __init__(self, client: boto3.client, bucket: str, partition_date: str):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = f'ROSIE/journal/CLEANER/{partition_date}/'
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def get_resource_key(self, row: dict) -> str:
+        return '|'.join('' if pd.isna(row.get(column)) else str(row.get(column)) for column in ['servico', 'database', 'tabela', 'nome_recurso'])
+
+    def get_key(self, resource_key: str, stage: str) -> str:
+        return f"{self.prefix}{stage}/{hashlib.sha1(resource_key.encode('utf-8')).hexdigest()}.json"
+
+    def load(self) -> dict:
+        """
+        Carrega as entradas já gravadas no diário da partição.
+
+        return:
+            dict: Entradas por recurso e etapa (`{recurso: {etapa: dados}}`).
+        """
+        entries = {}
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for file in page.get('Contents', []):
+                entry = json.loads(self.client.get_object(Bucket=self.bucket, Key=file['Key'])['Body'].read())
+                entries.setdefault(entry['resource'], {})[entry['stage']] = entry['data']
+
+        with self.lock:
+            self.entries = entries
+
+        print(f"Diário do cleaner carregado: {len(entries)} recurso(s) com progresso registrado")
+        return entries
+
+    def get(self, row: dict, stage: str):
+        with self.lock:
+            return self.entries.get(self.get_resource_key(row), {}).get(stage)
+
+    def record(self, row: dict, stage: str, data: dict = None) -> dict:
+        """
+        Grava a conclusão de uma etapa de um recurso no diário.
+
+        Args:
+            row (dict): Linha do recurso.
+            stage (str): Etapa concluída.
+            data (dict): Dados necessários para retomar a partir desta etapa.
+        return:
+            dict: Os dados gravados.
+        """
+        resource_key = self.get_resource_key(row)
+        data = data or {}
+
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self.get_key(resource_key, stage),
+            Body=json.dumps({
+                'resource': resource_key,
+                'stage': stage,
+                'data': data,
+                'recorded_at': datetime.datetime.now().isoformat()
+            })
+        )
+
+        with self.lock:
+            self.entries.setdefault(resource_key, {})[stage] = data
+
+        return data
+
+class RosieAthenaRunner:
+    """
+    Executor de queries no Athena com polling em backoff exponencial, reaproveitamento
+    do cliente e execução de várias queries em paralelo.
+
+    Attributes:
+        client (boto3.client): Cliente do Athena.
+        database (str): Database padrão das queries.
+        workgroup (str): Workgroup do Athena.
+        s3_output (str): Caminho S3 de saída dos resultados.
+        initial_delay (float): Primeiro intervalo de polling, em segundos.
+        max_delay (float): Intervalo máximo de polling, em segundos.
+    """
+    def __init__(self, client: boto3.client, database: str, workgroup: str = None, s3_output: str = None, initial_delay: float = 0.2, max_delay: float = 5.0):
+        self.client = client
+        self.database = database
+        self.workgroup = workgroup
+        self.s3_output = s3_output
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+
+    def start(self, query: str) -> str:
+        params = {
+            'QueryString': query,
+            'QueryExecutionContext': {
+                'Database': self.database
+            }
+        }
+        if self.s3_output:
+            params['ResultConfiguration'] = {'OutputLocation': self.s3_output}
+        if self.workgroup:
+            params['WorkGroup'] = self.workgroup
+
+        return self.client.start_query_execution(**params)['QueryExecutionId']
+
+    def wait(self, query_execution_id: str) -> dict:
+        delay = self.initial_delay
+
+        while True:
+            response = self.client.get_query_execution(
+                QueryExecutionId=query_execution_id
+            )
+            status = response['QueryExecution']['Status']['State']
+            if status not in ['QUEUED', 'RUNNING']:
+                break
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_delay)
+
+        if status != 'SUCCEEDED':
+            reason = response['QueryExecution']['Status'].get('StateChangeReason', '')
+            raise Exception(f"Erro ao executar a query {query_execution_id}: {status} {reason}")
+
+        return response
+
+    def fetch(self, query_execution_id: str) -> pd.DataFrame:
+        """
+        Lê o resultado de uma query com `get_query_results` paginado, tipando as
+        colunas numéricas conforme os metadados do resultado.
+
+        Args:
+            query_execution_id (str): ID da execução da query.
+        return:
+            pd.DataFrame: Resultado da query.
+        """
+        columns = None
+        types = None
+        rows = []
+
+        paginator = self.client.get_paginator('get_query_results')
+        for response in paginator.paginate(QueryExecutionId=query_execution_id):
+            page_rows = response['ResultSet']['Rows']
+            if columns is None:
+                column_info = response['ResultSet']['ResultSetMetadata']['ColumnInfo']
+                columns = [column['Name'] for column in column_info]
+                types = [column['Type'] for column in column_info]
+                page_rows = page_rows[1:]
+
+            for row in page_rows:
+                rows.append([data.get('VarCharValue') for data in row['Data']])
+
+        df = pd.DataFrame(rows, columns=columns)
+        for column, column_type in zip(columns or [], types or []):
+            if column_type in ['tinyint', 'smallint', 'integer', 'bigint']:
+                df[column] = pd.to_numeric(df[column]).astype('Int64')
+            elif column_type in ['float', 'real', 'double', 'decimal']:
+                df[column] = pd.to_numeric(df[column])
+
+        return df
+
+    def run(self, query: str) -> pd.DataFrame:
+        query_execution_id = self.start(query)
+        self.wait(query_execution_id)
+
+        return self.fetch(query_execution_id)
+
+    def run_many(self, queries: dict, max_workers: int = 5) -> dict:
+        """
+        Submete várias queries de uma vez e coleta os resultados conforme terminam.
+
+        Args:
+            queries (dict): Queries indexadas por um nome (ex: serviço ou data).
+            max_workers (int): Quantidade máxima de queries acompanhadas em paralelo.
+        return:
+            dict: Resultados (pd.DataFrame) indexados pelo mesmo nome das queries.
+        """
+        query_execution_ids = {name: self.start(query) for name, query in queries.items()}
+
+        def wait_and_fetch(name: str):
+            self.wait(query_execution_ids[name])
+            return self.fetch(query_execution_ids[name])
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(queries)))) as executor:
+            futures = {executor.submit(wait_and_fetch, name): name for name in queries}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                print(f"Query '{futures[future]}' finalizada com {len(results[futures[future]])} linha(s)")
+
+        return results
+
+class RosieCleaner:
+    """
+    Classe para limpeza de recursos monitorados pela ROSIE.
 
     Attributes:
         config (dict): Input do arquivo de configuração.
+        session (boto3.Session): Sessão compartilhada com os monitoramentos. Quando omitida, uma nova é criada.
+        client_factory (RosieClientFactory): Fábrica de clientes compartilhada. Quando omitida, uma nova é criada.
+        partition_date (str): Data (YYYY-MM-DD) da partição dos monitoramentos a ser limpa. Padrão: hoje.
+            O diário e a partição CLEANER usam esta data, para que uma retomada em outro dia
+            continue a limpeza da mesma partição.
     """
     def __init__(self,
                  config: dict,
+                 session: boto3.Session = None,
+                 client_factory: RosieClientFactory = None,
+                 partition_date: str = None,
                  ):
         
-        self.session = boto3.Session()
+        self.client_factory = client_factory or RosieClientFactory(config, session)
+        self.session = self.client_factory.session
         self.date_status = str(datetime.datetime.now().strftime('%Y-%m-%d'))
+        self.partition_date = partition_date or self.date_status
         self.config = config
-        self.table_monitor = RosieTableMonitor(config, self.date_status)
+        self.table_monitor = RosieTableMonitor(config, self.partition_date, self.client_factory)
+
+        runtime = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']
+        self.bucket = runtime['BUCKET_NAME']
+        self.enable_backup = runtime['BACKUP']['ENABLE_BACKUP']
+        self.region = config['ROSIE_INFOS']['INSTALLATION']['AWS_ACCOUNT']['AWS_REGION']
+        self.account_id = config['ROSIE_INFOS']['INSTALLATION']['AWS_ACCOUNT']['AWS_ACCOUNT_ID']
+        self.max_workers = runtime.get('CLEANER_MAX_WORKERS', 10)
+
+        self.clients = {service: self.client_factory.client(service) for service in ['glue', 's3', 'stepfunctions']}
+        self.s3_mover = RosieS3Mover(self.clients['s3'], max_workers=runtime.get('CLEANER_COPY_WORKERS', 16), purge_versions=runtime.get('CLEANER_PURGE_VERSIONS', False))
+        self.journal = RosieCleanerJournal(self.clients['s3'], self.bucket, self.partition_date)
+        self.metrics = self.client_factory.metrics
+
+    def save_metrics(self):
+        """
+        Grava as métricas da execução (chamadas à API e tempo por fase) na partição METRICS.
+        """
+        self.table_monitor.save_metrics(self.metrics)
+        self.table_monitor.wait()
 
     def get_list(
             self,
             services: list,
-            query_execution_id: str = None
+            query_execution_id: str = None,
+            backend: str = None
             ):
         """
         Método para buscar a lista de recursos monitorados pela ROSIE,
@@ -747,75 +2759,592 @@ class RosieCleaner:
 
         Args:
             services (str): Nome do recurso.
+            query_execution_id (str): ID da execução da query (apenas no backend ATHENA).
+            backend (str): `PARQUET` para ler as partições do dia direto do S3, ou `ATHENA`.
+                Quando omitido, usa `CLEANER_SOURCE` do config (padrão `PARQUET`).
+        return:
+            pd.DataFrame: Dataframe com a lista de recursos para deletar, tipado pelo schema da tabela de controle.
+        """
+
+        backend = (backend or self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME'].get('CLEANER_SOURCE', 'PARQUET')).upper()
+
+        if backend == 'ATHENA':
+            resource_list = self.get_list_athena(services=services, query_execution_id=query_execution_id)
+        else:
+            resource_list = self.get_list_parquet(services=services)
+
+        return RosieControlSchema().coerce(resource_list)
+
+    def get_list_parquet(
+            self,
+            services: list
+            ):
+        """
+        Lê a lista de recursos com status de DELETE direto dos arquivos Parquet das
+        partições `tipo=` de `partition_date`, filtrando `status == 'delete'` na leitura.
+
+        Args:
+            services (list): Tipos das partições a serem lidas.
+        return:
+            pd.DataFrame: Dataframe com a lista de recursos para deletar.
+        """
+        bucket = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['BUCKET_NAME']
+        tabela = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['TABLE_NAME']
+        client = self.clients['s3']
+        paginator = client.get_paginator('list_objects_v2')
+
+        ano = self.partition_date.split('-')[0]
+        mes = self.partition_date.split('-')[1]
+        dia = self.partition_date.split('-')[2]
+
+        frames = []
+        for service in services:
+            response_iterator = paginator.paginate(
+                Bucket=bucket,
+                Prefix=f'ROSIE/{tabela}/ano_dt_safra={ano}/mes_dt_safra={mes}/dia_dt_safra={dia}/tipo={service}/'
+            )
+
+            for response in response_iterator:
+                for file in response.get('Contents', []):
+                    if not file['Key'].endswith('.parquet'):
+                        continue
+
+                    body = client.get_object(Bucket=bucket, Key=file['Key'])['Body'].read()
+                    df = pq.read_table(io.BytesIO(body), filters=[('status', '==', 'delete')]).to_pandas()
+                    df['ano_dt_safra'] = ano
+                    df['mes_dt_safra'] = mes
+                    df['dia_dt_safra'] = dia
+                    df['tipo'] = service
+                    frames.append(df)
+
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['ano_dt_safra', 'mes_dt_safra', 'dia_dt_safra', 'tipo'])
+
+    def get_list_athena(
+            self,
+            services: list,
+            query_execution_id: str = None
+            ):
+        """
+        Busca a lista de recursos com status de DELETE executando uma query no Athena.
+
+        Args:
+            services (list): Tipos das partições a serem consultadas.
             query_execution_id (str): ID da execução da query.
         return:
             pd.DataFrame: Dataframe com a lista de recursos para deletar.
         """
 
-        services = ', '.join([f"'{item}'" for item in services])
-        workgroup = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['WORKGROUP_ATHENA']
-        database = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['DATABASE_NAME']
-        tabela = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['TABLE_NAME']
-        s3_output = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['S3_OUTPUT']
+        runtime = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']
+        database = runtime['DATABASE_NAME']
+        tabela = runtime['TABLE_NAME']
+
+        ano = self.partition_date.split('-')[0]
+        mes = self.partition_date.split('-')[1]
+        dia = self.partition_date.split('-')[2]
 
-        ano = self.date_status.split('-')[0]
-        mes = self.date_status.split('-')[1]
-        dia = self.date_status.split('-')[2]
+        runner = RosieAthenaRunner(
+            client=self.client_factory.client('athena'),
+            database=database,
+            workgroup=runtime.get('WORKGROUP_ATHENA'),
+            s3_output=runtime.get('S3_OUTPUT')
+        )
+
+        if query_execution_id:
+            runner.wait(query_execution_id)
+            return runner.fetch(query_execution_id)
 
-        query = f"""
+        queries = {}
+        for service in services:
+            queries[service] = f"""
             SELECT * 
             FROM {database}."{tabela}"
             WHERE ano_dt_safra = '{ano}'
             AND mes_dt_safra = '{mes}'
             AND dia_dt_safra = '{dia}'
             AND status = 'delete'
-            AND tipo IN ({services})"""
+            AND tipo = '{service}'"""
+
+        results = runner.run_many(queries)
+        frames = [results[service] for service in services]
+
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['ano_dt_safra', 'mes_dt_safra', 'dia_dt_safra', 'tipo'])
         
-        if not query_execution_id:
-            response = self.session.client('athena').start_query_execution(
-                QueryString=query,
-                QueryExecutionContext={
-                    'Database': database
-                },
-                ResultConfiguration={
-                    'OutputLocation': s3_output
-                },
-                WorkGroup=workgroup
+
+    def clean_glue(self, row: dict):
+        import pickle
+
+        resource = row['nome_recurso']
+        glue_client = self.clients['glue']
+        s3_client = self.clients['s3']
+
+        print(f"\nDeletando recurso GLUE")
+        if resource in rosie_resources:
+            return None
+
+        result = {}
+        backup = self.journal.get(row, 'backup')
+        try:
+            if self.enable_backup and backup is not None:
+                print(f"Backup dos metadados do recurso '{resource}' já realizado, pulando")
+            elif self.enable_backup:
+                print(f"Realizando backup dos metadados do recurso '{resource}'")
+                response = glue_client.get_job(
+                    JobName=resource
+                )
+                tags = glue_client.get_tags(
+                    ResourceArn=f"arn:aws:glue:{self.region}:{self.account_id}:job/{resource}"
+                )
+                metadata = response['Job']
+                metadata['Tags'] = tags['Tags']
+
+                s3_client.put_object(
+                    Bucket=f'{self.bucket}',
+                    Key=f"ROSIE/backup/GLUE/metadata/{metadata['Name']}.pkl",
+                    Body=pickle.dumps(metadata)
+                )
+                print(f"Backup dos metadados do recurso '{resource}' realizado com sucesso")
+                backup = self.journal.record(row, 'backup', {
+                    'name': metadata['Name'],
+                    'script_location': metadata['Command']['ScriptLocation']
+                })
+
+            print(f"Deletando recurso '{resource}'")
+            glue_client.delete_job(
+                JobName=resource
             )
+            print(f"Recurso '{resource}' deletado com sucesso")
 
-            query_execution_id = response['QueryExecutionId']
-        
-        status = 'RUNNING'
-        
-        while status == 'RUNNING':
-            time.sleep(5)
-            response = self.session.client('athena').get_query_execution(
-                QueryExecutionId=query_execution_id
+            result = {
+                'deleted': resource,
+                'dt_delete': self.date_status,
+                'status': 'deleted - backup' if self.enable_backup else 'deleted'
+            }
+
+        except Exception as e:
+            print(f"Erro ao fazer backup dos metadados do recurso e deletar o recurso '{resource}': {e}")
+
+            result = {'status': 'error'}
+                                
+        try:
+            if self.enable_backup:
+                print(f"Realizando backup do script '{resource}'")
+                script_location = backup['script_location']
+                s3_client.copy_object(
+                    Bucket=f'{self.bucket}',
+                    CopySource={
+                        'Bucket': script_location.split('/')[2],
+                        'Key': '/'.join(script_location.split('/')[3:])
+                    },
+                    Key=f"ROSIE/backup/GLUE/scripts/{backup['name']}.{script_location.split('.')[-1]}"
+                )
+                print(f"Backup do script '{resource}' realizado com sucesso")
+
+            print(f"Deletando script '{resource}'")
+            s3_client.delete_object(
+                Bucket=script_location.split('/')[2],
+                Key='/'.join(script_location.split('/')[3:])
             )
-            status = response['QueryExecution']['Status']['State']
+            print(f"Script '{resource}' deletado com sucesso")
 
-        if status != 'SUCCEEDED':
-            raise Exception(f"Erro ao executar a query: {query}")
-        
-        result_s3_path = response['QueryExecution']['ResultConfiguration']['OutputLocation']
-        result = self.session.client('s3').get_object(
-            Bucket=result_s3_path.split('/')[2],
-            Key='/'.join(result_s3_path.split('/')[3:])
-        )
-        result = pd.read_csv(result['Body'])
+        except Exception as e:
+            print(f"Erro ao fazer backup do script e deletar o script '{resource}': {e}")
+
+        if result.get('deleted'):
+            self.journal.record(row, 'delete', result)
 
         return result
+
+    def clean_sfn(self, row: dict):
+        import pickle
+
+        resource = row['nome_recurso']
+        sfn_client = self.clients['stepfunctions']
+        s3_client = self.clients['s3']
+
+        print(f"\nDeletando recurso STEP FUNCTIONS")
+        if resource in rosie_resources:
+            return None
+
+        try:
+            if self.enable_backup and self.journal.get(row, 'backup') is not None:
+                print(f"Backup dos metadados do recurso '{resource}' já realizado, pulando")
+            elif self.enable_backup:
+                print(f"Realizando backup dos metadados do recurso '{resource}'")
+                response = sfn_client.describe_state_machine(
+                    stateMachineArn=f"arn:aws:states:{self.region}:{self.account_id}:stateMachine:{resource}"
+                )
+                response.pop('ResponseMetadata', None)
+                definition = response['definition']
+                response.pop('definition', None)
+                s3_client.put_object(
+                    Bucket=f'{self.bucket}',
+                    Key=f"ROSIE/backup/STEP_FUNCTIONS/metadata/{resource}.pkl",
+                    Body=pickle.dumps(response)
+                )
+                s3_client.put_object(
+                    Bucket=f'{self.bucket}',
+                    Key=f"ROSIE/backup/STEP_FUNCTIONS/definition/{resource}.json",
+                    Body=json.dumps(definition)
+                )
+                self.journal.record(row, 'backup')
+                print(f"Backup dos metadados do recurso '{resource}' realizado com sucesso")
+
+            print(f"Deletando recurso '{resource}'")
+            sfn_client.delete_state_machine(
+                stateMachineArn=f"arn:aws:states:{self.region}:{self.account_id}:stateMachine:{resource}"
+            )
+            print(f"Recurso '{resource}' deletado com sucesso")
+
+            return self.journal.record(row, 'delete', {
+                'deleted': resource,
+                'dt_delete': self.date_status,
+                'status': 'deleted - backup' if self.enable_backup else 'deleted'
+            })
+        except Exception as e:
+            print(f"Erro ao realizar backup dos metadados e deletar o recurso '{resource}': {e}")
+
+            return {'status': 'error'}
+
+    def clean_s3(self, row: dict):
+        resource = row['nome_recurso']
+        s3_client = self.clients['s3']
+
+        print(f"\nDeletando recurso S3")
+        if resource in rosie_resources:
+            return None
+
+        try:
+            bucket_name = resource.split('/')[2]
+            prefix = '/'.join(resource.split('/')[3:])
+
+            if self.enable_backup and self.journal.get(row, 'backup') is not None:
+                print(f"Backup dos dados do recurso '{resource}' já realizado, pulando")
+            elif self.enable_backup:
+                print(f"Realizando backup dos dados do recurso '{resource}'")
+                failures = self.s3_mover.copy_prefix(bucket_name, prefix, self.bucket, 'ROSIE/backup/S3/')
+                if failures:
+                    raise Exception(f"{len(failures)} objeto(s) sem backup: {failures[:10]}")
+                
+                print(f"Backup dos dados do recurso '{resource}' realizado com sucesso")
+                self.journal.record(row, 'backup')
+
+            # Assim como na versão original (bucketr), a deleção é feita no bucket da ROSIE
+            print(f"Deletando recurso '{resource}'")
+            failures = self.s3_mover.delete_prefix(self.bucket, prefix)
+            if failures:
+                raise Exception(f"{len(failures)} objeto(s) não deletado(s): {failures[:10]}")
+            print(f"Recurso '{resource}' deletado com sucesso")
+
+            return self.journal.record(row, 'delete', {
+                'deleted': f's3://{self.bucket}/{resource}',
+                'dt_delete': self.date_status,
+                'status': 'deleted - backup' if self.enable_backup else 'deleted'
+            })
+        except Exception as e:
+            print(f"Erro ao realizar backup dos dados e deletar o recurso '{resource}': {e}")
+
+            return {'status': 'error'}
+
+    def clean_data_catalog_tables(self, database: str, rows: list) -> dict:
+        """
+        Faz o backup dos metadados e deleta as tabelas de um mesmo database em lote: os
+        metadados vêm de uma única listagem paginada com `get_tables` e a deleção usa
+        `batch_delete_table` com até 100 tabelas por chamada. Erros de cada tabela são
+        mapeados de volta para o status da respectiva linha.
+
+        Args:
+            database (str): Nome do database.
+            rows (list): Pares (índice, linha) das tabelas do database a serem deletadas.
+        return:
+            dict: Resultado da deleção de cada tabela (`status`, `dt_delete`) indexado pelo índice da linha.
+        """
+        import pickle
+
+        glue_client = self.clients['glue']
+        s3_client = self.clients['s3']
+
+        results = {}
+        pending = {}
+        for index, row in rows:
+            done = self.journal.get(row, 'table')
+            if done is not None:
+                print(f"Recurso '{database}.{row['tabela']}' já deletado, pulando")
+                results[index] = done
+            else:
+                pending[index] = row
+
+        if self.enable_backup:
+            # Tabelas com backup já registrado no diário não são buscadas de novo: em uma
+            # retomada elas podem já ter sido deletadas sem o registro da etapa 'table'.
+            to_backup = {index: row for index, row in pending.items() if self.journal.get(row, 'backup') is None}
+
+            if to_backup:
+                print(f"Realizando backup dos metadados de {len(to_backup)} tabela(s) do database '{database}'")
+                names = {row['tabela'] for row in to_backup.values()}
+                metadata = {}
+                try:
+                    for page in glue_client.get_paginator('get_tables').paginate(DatabaseName=database):
+                        for table in page['TableList']:
+                            if table['Name'] in names:
+                                metadata[table['Name']] = table
+                except Exception as e:
+                    print(f"Erro ao buscar os metadados das tabelas do database '{database}': {e}")
+
+            for index, row in to_backup.items():
+                table = row['tabela']
+                try:
+                    if table not in metadata:
+                        raise Exception(f"tabela não encontrada no database '{database}'")
+
+                    s3_client.put_object(
+                        Bucket=f'{self.bucket}',
+                        Key=f"ROSIE/backup/DATA_CATALOG/metadata/{database}.{table}.pkl",
+                        Body=pickle.dumps({'Table': metadata[table]})
+                    )
+                    self.journal.record(row, 'backup')
+                    print(f"Backup dos metadados do recurso '{database}.{table}' realizado com sucesso")
+                except Exception as e:
+                    print(f"Erro ao realizar backup dos metadados e deletar o recurso '{database}.{table}': {e}")
+                    results[index] = {'status': 'error'}
+                    del pending[index]
+
+        indexes = list(pending)
+        for start in range(0, len(indexes), 100):
+            chunk = indexes[start:start + 100]
+            names = list(dict.fromkeys(pending[index]['tabela'] for index in chunk))
+
+            print(f"Deletando {len(names)} tabela(s) do database '{database}'")
+            try:
+                response = glue_client.batch_delete_table(
+                    DatabaseName=database,
+                    TablesToDelete=names
+                )
+                errors = {error['TableName']: error['ErrorDetail'] for error in response.get('Errors', [])}
+            except Exception as e:
+                errors = {name: {'ErrorCode': type(e).__name__, 'ErrorMessage': str(e)} for name in names}
+
+            for index in chunk:
+                row = pending[index]
+                table = row['tabela']
+                if table in errors and errors[table].get('ErrorCode') == 'EntityNotFoundException':
+                    # Deletada em uma execução anterior que não chegou a registrar a etapa no diário
+                    print(f"Recurso '{database}.{table}' já havia sido deletado")
+                elif table in errors:
+                    print(f"Erro ao realizar backup dos metadados e deletar o recurso '{database}.{table}': {errors[table].get('ErrorCode')}: {errors[table].get('ErrorMessage')}")
+                    results[index] = {'status': 'error'}
+                    continue
+                else:
+                    print(f"Recurso '{database}.{table}' deletado com sucesso")
+
+                results[index] = self.journal.record(row, 'table', {
+                    'dt_delete': self.date_status,
+                    'status': 'deleted - backup' if self.enable_backup else 'deleted'
+                })
+
+        return results
+
+    def clean_data_catalog(self, row: dict, result: dict = None):
+        """
+        Realiza o backup e a deleção dos dados da tabela no S3. A tabela em si já foi
+        deletada em lote por `clean_data_catalog_tables`, cujo resultado é recebido em `result`.
+
+        Args:
+            row (dict): Linha do recurso.
+            result (dict): Resultado da deleção da tabela.
+        return:
+            dict: Resultado da linha (`status`, `dt_delete`, `deleted`).
+        """
+        print(f"\nDeletando recurso DATA CATALOG")
+
+        database = row['database']
+        table = row['tabela']
+        bucket = row['nome_recurso'].split('/')[2]
+        s3_path = '/'.join(row['nome_recurso'].split('/')[3:])
+
+        if table in rosie_resources:
+            return None
+
+        result = result or {'status': 'error'}
         
+        try:
+            if self.enable_backup:
+                print(f"Realizando backup dos dados no {s3_path}, respectivo a tabela lógica '{database}.{table}'")
+                if s3_path not in ['', 'dados/']:
+                    print(f"Deletando dados no {s3_path}, respectivo a tabela lógica '{database}.{table}'")
+                    
+                    failures = self.s3_mover.copy_prefix(bucket, s3_path, self.bucket, 'ROSIE/backup/DATA_CATALOG/data/')
+                    if failures:
+                        raise Exception(f"{len(failures)} objeto(s) sem backup: {failures[:10]}")
+
+                    failures = self.s3_mover.delete_prefix(bucket, s3_path)
+                    if failures:
+                        raise Exception(f"{len(failures)} objeto(s) não deletado(s): {failures[:10]}")
+                    print(f"Dados deletados com sucesso!")
+        except Exception as e:
+            print(f"Erro ao deletar os dados no {s3_path}, respectivo a tabela lógica '{database}.{table}': {e}")                    
+
+        result = dict(result, deleted=f'{database}.{table}')
+        if result['status'] != 'error':
+            self.journal.record(row, 'delete', result)
+
+        return result
+
+    def execute(self, resource_list: pd.DataFrame) -> dict:
+        """
+        Executa a deleção dos recursos em um pool de threads limitado por `CLEANER_MAX_WORKERS`,
+        agrupando o trabalho por serviço. A vazão das chamadas é controlada pelo
+        `RosieRateScheduler` da fábrica de clientes, configurado por operação em
+        `API_RATE_LIMITS` (ex: {"glue.DeleteJob": 5, "s3.DeleteObjects": 20}). Recursos cuja
+        deleção já consta no diário não são processados novamente e linhas repetidas do mesmo
+        recurso são processadas uma única vez. Linhas de S3 e DATA_CATALOG com prefixos
+        aninhados rodam em sequência (`group_overlapping`). As tabelas do DATA_CATALOG são
+        deletadas em lote por database antes da limpeza dos seus dados.
+
+        Args:
+            resource_list (pd.DataFrame): Lista de recursos para deletar.
+        return:
+            dict: Resultado de cada linha (`status`, `dt_delete`, `deleted`) indexado pelo índice do DataFrame.
+        """
+        handlers = {
+            'GLUE': self.clean_glue,
+            'STEP_FUNCTIONS': self.clean_sfn,
+            'S3': self.clean_s3,
+            'DATA_CATALOG': self.clean_data_catalog,
+        }
+
+        table_results = {}
+
+        def run(items: list):
+            # Itens de um mesmo grupo (prefixos aninhados) rodam em sequência na mesma thread
+            return [
+                (index, handlers[service](row, table_results.get(index)) if service == 'DATA_CATALOG' else handlers[service](row))
+                for service, index, row in items
+            ]
+
+        self.journal.load()
+
+        results = {}
+        items = []
+        seen = set()
+        catalog = {}
+        for service, group in resource_list.groupby('servico', sort=False):
+            if service not in handlers:
+                continue
+            for index, row in group.iterrows():
+                row = {key: None if value is pd.NA else value for key, value in row.items()}
+                resource_key = self.journal.get_resource_key(row)
+                if resource_key in seen:
+                    print(f"Recurso '{row['nome_recurso']}' duplicado na lista, pulando")
+                    continue
+                seen.add(resource_key)
+
+                done = self.journal.get(row, 'delete')
+                if done is not None:
+                    print(f"Recurso '{row['nome_recurso']}' já processado nesta partição, pulando")
+                    results[index] = done
+                    continue
+                if service == 'DATA_CATALOG':
+                    catalog.setdefault(row['database'], []).append((index, row))
+                items.append((service, index, row))
+
+        groups = self.group_overlapping(items)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Grupos sem DATA_CATALOG começam de imediato; os demais aguardam a deleção das tabelas
+            futures = [executor.submit(run, group) for group in groups if all(service != 'DATA_CATALOG' for service, _, _ in group)]
+
+            table_futures = [
+                executor.submit(self.clean_data_catalog_tables, database, [(index, row) for index, row in rows if row['tabela'] not in rosie_resources])
+                for database, rows in catalog.items()
+            ]
+            for future in as_completed(table_futures):
+                table_results.update(future.result())
+
+            futures.extend(executor.submit(run, group) for group in groups if any(service == 'DATA_CATALOG' for service, _, _ in group))
+
+            for future in as_completed(futures):
+                results.update(future.result())
+
+        return results
+
+    def get_prefixes(self, service: str, row: dict) -> list:
+        """
+        Retorna os prefixos do S3 lidos ou deletados pela limpeza de uma linha.
+
+        Args:
+            service (str): Serviço da linha.
+            row (dict): Linha do recurso.
+        return:
+            list: Pares (bucket, prefixo).
+        """
+        if service == 'S3':
+            prefix = '/'.join(row['nome_recurso'].split('/')[3:])
+            return [(row['nome_recurso'].split('/')[2], prefix), (self.bucket, prefix)]
+
+        if service == 'DATA_CATALOG' and self.enable_backup and row['tabela'] not in rosie_resources:
+            s3_path = '/'.join(row['nome_recurso'].split('/')[3:])
+            if s3_path not in ['', 'dados/']:
+                return [(row['nome_recurso'].split('/')[2], s3_path)]
+
+        return []
+
+    def group_overlapping(self, items: list) -> list:
+        """
+        Agrupa as linhas cujos prefixos do S3 se sobrepõem (um contém o outro), para que
+        sejam processadas em sequência e a cópia de uma não concorra com a deleção da outra.
+        Linhas sem prefixo formam grupos próprios. Dentro do grupo, os prefixos mais
+        específicos são processados antes dos mais amplos.
+
+        Args:
+            items (list): Tuplas (serviço, índice, linha).
+        return:
+            list: Grupos de tuplas (serviço, índice, linha).
+        """
+        parents = list(range(len(items)))
+
+        def find(position: int) -> int:
+            while parents[position] != position:
+                parents[position] = parents[parents[position]]
+                position = parents[position]
+            return position
+
+        prefixes = {}
+        locations = []
+        for position, (service, _, row) in enumerate(items):
+            locations.append(self.get_prefixes(service, row))
+            for bucket, prefix in locations[-1]:
+                prefixes.setdefault(bucket, []).append((prefix, position))
+
+        for entries in prefixes.values():
+            # Em ordem lexicográfica, os prefixos contidos em `root` vêm logo depois dele
+            root, root_position = None, None
+            for prefix, position in sorted(entries):
+                if root is not None and prefix.startswith(root):
+                    parents[find(position)] = find(root_position)
+                else:
+                    root, root_position = prefix, position
+
+        groups = {}
+        for position in range(len(items)):
+            groups.setdefault(find(position), []).append(position)
+
+        return [
+            [items[position] for position in sorted(positions, key=lambda position: max((len(prefix) for _, prefix in locations[position]), default=0), reverse=True)]
+            for positions in groups.values()
+        ]
 
     def clean(
             self,
             services: list,
+            resource_list=None,
     ):
         """
         Método para deletar os recursos monitorados pela ROSIE.
 
         Args:
             services (str): Nomes dos recurso.
+            resource_list (list | pd.DataFrame): Registros classificados recebidos direto dos
+                monitoramentos (modo combinado). Quando omitido, a lista é lida com `get_list`.
         """
 
         glue_list = []
@@ -823,232 +3352,47 @@ class RosieCleaner:
         s3_list = []
         data_catalog_list = []
         unmapped_list = []
-        BUCKET = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['BUCKET_NAME']
-        ENABLE_BACKUP = self.config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['BACKUP']['ENABLE_BACKUP']
-        AWS_REGION = self.config['ROSIE_INFOS']['INSTALLATION']['AWS_ACCOUNT']['AWS_REGION']
-        AWS_ACCOUNT_ID = self.config['ROSIE_INFOS']['INSTALLATION']['AWS_ACCOUNT']['AWS_ACCOUNT_ID']
-
-        bucketr = self.session.resource('s3').Bucket(BUCKET)
-
-        resource_list = self.get_list(services=services)
-        resource_list = resource_list.drop(columns=['ano_dt_safra', 'mes_dt_safra', 'dia_dt_safra', 'tipo'])
-
-        print("Total de recursos para deletar:", len(resource_list))
-
-        for index, row in resource_list.iterrows():
-            resource = row['nome_recurso']
-            
-            if row['servico'] == 'GLUE':
-                print(f"\nDeletando recurso GLUE")
-                if resource in rosie_resources:
-                    continue
-                else:
-                    try:
-                        if ENABLE_BACKUP:
-                            print(f"Realizando backup dos metadados do recurso '{resource}'")
-                            response = self.session.client('glue').get_job(
-                                JobName=resource
-                            )
-                            tags = self.session.client('glue').get_tags(
-                                ResourceArn=f"arn:aws:glue:{AWS_REGION}:{AWS_ACCOUNT_ID}:job/{resource}"
-                            )
-                            metadata = response['Job']
-                            metadata['Tags'] = tags['Tags']
-
-                            self.session.client('s3').put_object(
-                                Bucket=f'{BUCKET}',
-                                Key=f"ROSIE/backup/GLUE/metadata/{metadata['Name']}.pkl",
-                                Body=pickle.dumps(metadata)
-                            )
-                            print(f"Backup dos metadados do recurso '{resource}' realizado com sucesso")
-
-                        print(f"Deletando recurso '{resource}'")
-                        self.session.client('glue').delete_job(
-                            JobName=resource
-                        )
-                        print(f"Recurso '{resource}' deletado com sucesso")
-                        glue_list.append(resource)
-
-                        resource_list.at[index, 'dt_delete'] = self.date_status
-                        resource_list.at[index, 'status'] = 'deleted - backup' if ENABLE_BACKUP else 'deleted'
-
-                    except Exception as e:
-                        print(f"Erro ao fazer backup dos metadados do recurso e deletar o recurso '{resource}': {e}")
-
-                        resource_list.at[index, 'status'] = 'error'
-                                            
-                    try:
-                        if ENABLE_BACKUP:
-                            print(f"Realizando backup do script '{resource}'")
-                            script_location = response['Job']['Command']['ScriptLocation']
-                            self.session.client('s3').copy_object(
-                                Bucket=f'{BUCKET}',
-                                CopySource={
-                                    'Bucket': script_location.split('/')[2],
-                                    'Key': '/'.join(script_location.split('/')[3:])
-                                },
-                                Key=f"ROSIE/backup/GLUE/scripts/{response['Job']['Name']}.{script_location.split('.')[-1]}"
-                            )
-                            print(f"Backup do script '{resource}' realizado com sucesso")
 
-                        print(f"Deletando script '{resource}'")
-                        self.session.client('s3').delete_object(
-                            Bucket=script_location.split('/')[2],
-                            Key='/'.join(script_location.split('/')[3:])
-                        )
-                        print(f"Script '{resource}' deletado com sucesso")
-
-                    except Exception as e:
-                        print(f"Erro ao fazer backup do script e deletar o script '{resource}': {e}")
+        if resource_list is None:
+            with self.metrics.phase('CLEANER', 'list'):
+                resource_list = self.get_list(services=services)
+        else:
+            resource_list = RosieControlSchema().coerce(resource_list if isinstance(resource_list, pd.DataFrame) else pd.DataFrame(list(resource_list)))
+            mask = (resource_list['status'] == 'delete') & resource_list['servico'].isin(services)
+            resource_list = resource_list[mask.fillna(False).astype(bool)].reset_index(drop=True)
 
-            elif row['servico'] == 'STEP_FUNCTIONS':
-                print(f"\nDeletando recurso STEP FUNCTIONS")
-                if resource in rosie_resources:
-                    continue
-                else:
-                    try:
-                        if ENABLE_BACKUP:
-                            print(f"Realizando backup dos metadados do recurso '{resource}'")
-                            response = self.session.client('stepfunctions').describe_state_machine(
-                                stateMachineArn=f"arn:aws:states:{AWS_REGION}:{AWS_ACCOUNT_ID}:stateMachine:{resource}"
-                            )
-                            response.pop('ResponseMetadata', None)
-                            definition = response['definition']
-                            response.pop('definition', None)
-                            self.session.client('s3').put_object(
-                                Bucket=f'{BUCKET}',
-                                Key=f"ROSIE/backup/STEP_FUNCTIONS/metadata/{resource}.pkl",
-                                Body=pickle.dumps(response)
-                            )
-                            self.session.client('s3').put_object(
-                                Bucket=f'{BUCKET}',
-                                Key=f"ROSIE/backup/STEP_FUNCTIONS/definition/{resource}.json",
-                                Body=json.dumps(definition)
-                            )
-                            print(f"Backup dos metadados do recurso '{resource}' realizado com sucesso")
+        resource_list = resource_list.drop(columns=['ano_dt_safra', 'mes_dt_safra', 'dia_dt_safra', 'tipo'], errors='ignore')
 
-                        print(f"Deletando recurso '{resource}'")
-                        self.session.client('stepfunctions').delete_state_machine(
-                            stateMachineArn=f"arn:aws:states:{AWS_REGION}:{AWS_ACCOUNT_ID}:stateMachine:{resource}"
-                        )
-                        print(f"Recurso '{resource}' deletado com sucesso")
-                        sfn_list.append(resource)
+        # Reexecuções dos monitoramentos no mesmo dia deixam o mesmo recurso em vários arquivos da partição
+        resource_keys = pd.Series([self.journal.get_resource_key(row) for row in resource_list.to_dict('records')], index=resource_list.index, dtype=object)
+        resource_list = resource_list[~resource_keys.duplicated()].reset_index(drop=True)
 
-                        resource_list.at[index, 'dt_delete'] = self.date_status
-                        resource_list.at[index, 'status'] = 'deleted - backup' if ENABLE_BACKUP else 'deleted'
-                    except Exception as e:
-                        print(f"Erro ao realizar backup dos metadados e deletar o recurso '{resource}': {e}")
+        print("Total de recursos para deletar:", len(resource_list))
 
-                        resource_list.at[index, 'status'] = 'error'
+        with self.metrics.phase('CLEANER', 'clean'):
+            results = self.execute(resource_list)
+        deleted_lists = {
+            'GLUE': glue_list,
+            'STEP_FUNCTIONS': sfn_list,
+            'S3': s3_list,
+            'DATA_CATALOG': data_catalog_list,
+        }
 
-            elif row['servico'] == 'S3':
-                print(f"\nDeletando recurso S3")
-                if resource in rosie_resources:
-                    continue
-                else:
-                    try:
-                        if ENABLE_BACKUP:
-                            print(f"Realizando backup dos dados do recurso '{resource}'")
-                            bucket_name = resource.split('/')[2]
-                            prefix = '/'.join(resource.split('/')[3:])
-                            
-                            bucket = self.session.resource('s3').Bucket(bucket_name)
-                            
-                            objects = bucket.objects.filter(Prefix=prefix)
-                            
-                            for obj in objects:
-                                copy_source = {
-                                    'Bucket': bucket_name,
-                                    'Key': obj.key
-                                }
-                                destination_key = f"ROSIE/backup/S3/{obj.key}"
-                                self.session.client('s3').copy_object(
-                                    Bucket=BUCKET,
-                                    CopySource=copy_source,
-                                    Key=destination_key
-                                )
-                            
-                            print(f"Backup dos dados do recurso '{resource}' realizado com sucesso")
-
-                        print(f"Deletando recurso '{resource}'")
-                        bucketr.objects.filter(Prefix='/'.join(resource.split('/')[3:])).delete()
-                        print(f"Recurso '{resource}' deletado com sucesso")
-                        s3_list.append(f's3://{BUCKET}/{resource}')
-
-                        resource_list.at[index, 'dt_delete'] = self.date_status
-                        resource_list.at[index, 'status'] = 'deleted - backup' if ENABLE_BACKUP else 'deleted'
-                    except Exception as e:
-                        print(f"Erro ao realizar backup dos dados e deletar o recurso '{resource}': {e}")
-
-                        resource_list.at[index, 'status'] = 'error'
-
-            elif row['servico'] == 'DATA_CATALOG':
-                print(f"\nDeletando recurso DATA CATALOG")
-
-                database = row['database']
-                table = row['tabela']
-                bucket = row['nome_recurso'].split('/')[2]
-                s3_path = '/'.join(row['nome_recurso'].split('/')[3:])
+        for index, row in resource_list.iterrows():
+            if row['servico'] not in deleted_lists:
+                unmapped_list.append(row['nome_recurso'])
+                continue
 
-                if table in rosie_resources:
-                    continue
-                else:
-                    try:
-                        if ENABLE_BACKUP:
-                            print(f"Realizando backup dos metadados do recurso '{database}.{table}'")
-                            response = self.session.client('glue').get_table(
-                                DatabaseName=database,
-                                Name=table
-                            )
-                            response.pop('ResponseMetadata', None)
-                            self.session.client('s3').put_object(
-                                Bucket=f'{BUCKET}',
-                                Key=f"ROSIE/backup/DATA_CATALOG/metadata/{database}.{table}.pkl",
-                                Body=pickle.dumps(response)
-                            )
-                            print(f"Backup dos metadados do recurso '{database}.{table}' realizado com sucesso")
+            result = self.journal.get(row, 'delete') or results.get(index)
+            if not result:
+                continue
 
-                        print(f"Deletando recurso '{database}.{table}'")
-                        self.session.client('glue').delete_table(
-                            DatabaseName=database,
-                            Name=table
-                        )
-                        print(f"Recurso '{database}.{table}' deletado com sucesso")
+            if result.get('deleted'):
+                deleted_lists[row['servico']].append(result['deleted'])
+            if result.get('dt_delete'):
+                resource_list.at[index, 'dt_delete'] = result['dt_delete']
+            resource_list.at[index, 'status'] = result['status']
 
-                        resource_list.at[index, 'dt_delete'] = self.date_status
-                        resource_list.at[index, 'status'] = 'deleted - backup' if ENABLE_BACKUP else 'deleted'
-                    except Exception as e:
-                        print(f"Erro ao realizar backup dos metadados e deletar o recurso '{database}.{table}': {e}")
-                        resource_list.at[index, 'status'] = 'error'
-                    
-                    try:
-                        if ENABLE_BACKUP:
-                            print(f"Realizando backup dos dados no {s3_path}, respectivo a tabela lógica '{database}.{table}'")
-                            if s3_path not in ['', 'dados/']:
-                                print(f"Deletando dados no {s3_path}, respectivo a tabela lógica '{database}.{table}'")
-                                
-                                objects = self.session.resource('s3').Bucket(bucket).objects.filter(Prefix=s3_path)
-
-                                for obj in objects:
-                                    copy_source = {
-                                        'Bucket': bucket,
-                                        'Key': obj.key
-                                    }
-                                    destination_key = f"ROSIE/backup/DATA_CATALOG/data/{obj.key}"
-                                    self.session.client('s3').copy_object(
-                                        Bucket=BUCKET,
-                                        CopySource=copy_source,
-                                        Key=destination_key
-                                    )
-                                self.session.resource('s3').Bucket(bucket).objects.filter(Prefix=s3_path).delete()
-                                print(f"Dados deletados com sucesso!")
-                    except Exception as e:
-                        print(f"Erro ao deletar os dados no {s3_path}, respectivo a tabela lógica '{database}.{table}': {e}")                    
-
-                    data_catalog_list.append(f'{database}.{table}')
-            else:
-                resource = row['nome_recurso']
-                unmapped_list.append(row['nome_recurso'])
 
         print("\nLista de recursos GLUE deletados: ", glue_list)
         print("Total de recursos GLUE deletados: ", len(glue_list))
@@ -1061,24 +3405,11 @@ class RosieCleaner:
         print("Lista de recursos não mapeados: ", unmapped_list)
         print("Total de recursos não mapeados: ", len(unmapped_list))
         
-        resource_list = resource_list.astype(str)
-        resource_list = resource_list.applymap(lambda x: None if x in ['None', 'nan'] else x)
-        
-        def safe_int_conversion(x):
-            if x is None:
-                return None
-            return int(float(x))
-        
-        resource_list['dias_criacao'] = resource_list['dias_criacao'].apply(lambda x: x.split('.')[0] if x is not None else x)
-        resource_list['dias_criacao'] = resource_list['dias_criacao'].apply(safe_int_conversion)
-        resource_list['dias_ultima_atualizacao'] = resource_list['dias_ultima_atualizacao'].apply(lambda x: x.split('.')[0] if x is not None else x)
-        resource_list['dias_ultima_atualizacao'] = resource_list['dias_ultima_atualizacao'].apply(safe_int_conversion)
-        resource_list['qtd_execucoes'] = resource_list['qtd_execucoes'].apply(lambda x: x.split('.')[0] if x is not None else x)
-        resource_list['qtd_execucoes'] = resource_list['qtd_execucoes'].apply(safe_int_conversion)
-        
-        resource_list['dias_criacao'] = resource_list['dias_criacao'].astype('Int64')
-        resource_list['dias_ultima_atualizacao'] = resource_list['dias_ultima_atualizacao'].astype('Int64')
-        resource_list['qtd_execucoes'] = resource_list['qtd_execucoes'].astype('Int64')
-
-        self.table_monitor.save_result(verify_list=resource_list.to_dict('records'), service='CLEANER')
-        self.table_monitor.create_partition(service='CLEANER')
\ No newline at end of file
+        # Cada serviço tem os próprios arquivos na partição CLEANER: uma nova execução substitui
+        # apenas as linhas dos serviços que processou, preservando as das demais execuções
+        with self.metrics.phase('CLEANER', 'write'):
+            for service in services:
+                file_name = f'{self.partition_date}-{service}'
+                self.table_monitor.clear_partition(service='CLEANER', file_name=file_name)
+                self.table_monitor.save_result(verify_list=resource_list[(resource_list['servico'] == service).fillna(False).astype(bool)], service='CLEANER', file_name=file_name)
+            self.table_monitor.create_partition(service='CLEANER')
\ No newline at end of file
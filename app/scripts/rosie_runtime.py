@@ -0,0 +1,164 @@
+import time
+started = time.perf_counter()
+
+import sys
+import boto3
+import json
+import os
+import argparse
+import importlib.util
+
+# Bootstrap único dos jobs da ROSIE. Os scripts de cada monitoramento (glue_monitoring.py, ...)
+# importam este módulo (via --extra-py-files) e chamam `main` com o --MONITORS fixo.
+
+checkpoints = [('start', started)]
+
+def mark(step):
+    checkpoints.append((step, time.perf_counter()))
+
+mark('imports')
+
+DOWNLOAD_DIR = 'tmp'
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--MONITORS', default='GLUE_MONITORING,STEP_FUNCTIONS_MONITORING,S3_MONITORING,DATA_CATALOG_MONITORING')
+    parser.add_argument('--ROSIE_BUCKET', default=None)
+    parser.add_argument('--ROSIE_CONFIG', default='config.json')
+    parser.add_argument('--PARTITION_DATE', default=None)
+    parser.add_argument('--profile-startup', nargs='?', const='true', default='false')
+    args, _ = parser.parse_known_args()
+    return args
+
+def get_bucket(session, bucket: str = None, config_path: str = 'config.json'):
+    """
+    Retorna o bucket da ROSIE informado no argumento --ROSIE_BUCKET do job e, na ausência
+    dele, o BUCKET_NAME do config de instalação local (--ROSIE_CONFIG). Sem BUCKET_NAME, o
+    nome é montado como no instalador, com o AWS_ACCOUNT_ID do config e a região da sessão.
+    """
+    if bucket:
+        return bucket
+
+    try:
+        with open(config_path, 'r') as f:
+            installation = json.load(f)['ROSIE_INFOS']['INSTALLATION']
+    except (FileNotFoundError, ValueError, KeyError) as e:
+        raise ValueError(f"Bucket da ROSIE não encontrado: informe --ROSIE_BUCKET ou um config de instalação válido em --ROSIE_CONFIG ({config_path}): {e}")
+
+    bucket = installation.get('RUNTIME', {}).get('BUCKET_NAME')
+    if bucket:
+        return bucket
+
+    account_id = installation.get('AWS_ACCOUNT', {}).get('AWS_ACCOUNT_ID')
+    if not account_id or not session.region_name:
+        raise ValueError(f"Bucket da ROSIE não encontrado: o config {config_path} não tem RUNTIME.BUCKET_NAME nem AWS_ACCOUNT.AWS_ACCOUNT_ID, ou a sessão não tem região")
+
+    return f"itau-self-wkp-{session.region_name}-{account_id}"
+
+
+def validate_config(config):
+    installation = config['ROSIE_INFOS']['INSTALLATION']
+    for section, keys in [('RUNTIME', ['BUCKET_NAME', 'DATABASE_NAME', 'TABLE_NAME', 'MONITORING', 'BACKUP']), ('AWS_ACCOUNT', ['AWS_REGION', 'AWS_ACCOUNT_ID'])]:
+        for key in keys:
+            if key not in installation[section]:
+                raise KeyError(f"Chave '{key}' ausente em ROSIE_INFOS.INSTALLATION.{section} do arquivo de configuração")
+
+def load_rosie(session, bucket):
+    """
+    Baixa o config.json, o rosie.py e o schema da tabela de controle do bucket da ROSIE e importa o módulo. Os jobs
+    pythonshell começam cada execução em um container novo, por isso o download é sempre completo.
+
+    return:
+        tuple: Módulo rosie e config.
+    """
+    s3_client = session.client('s3')
+
+    if not os.path.exists(DOWNLOAD_DIR):
+        os.makedirs(DOWNLOAD_DIR)
+
+    try:
+        s3_client.download_file(bucket, 'ROSIE/src/config.json', os.path.join(DOWNLOAD_DIR, 'config.json'))
+    except Exception as e:
+        print(f"Error ao fazer o download do arquivo de configuração: {e}")
+
+    try:
+        s3_client.download_file(bucket, 'ROSIE/src/rosie.py', os.path.join(DOWNLOAD_DIR, 'rosie.py'))
+        # Schema da tabela de controle, lido pelo rosie.py a partir do mesmo diretório
+        s3_client.download_file(bucket, 'ROSIE/src/rosie-control_table.json', os.path.join(DOWNLOAD_DIR, 'rosie-control_table.json'))
+    except Exception as e:
+        print(f"Error ao fazer o download do arquivo de módulo Rosie: {e}")
+
+    mark('download')
+
+    sys.path.append(DOWNLOAD_DIR)
+
+    try:
+        with open(os.path.join(DOWNLOAD_DIR, 'config.json'), 'r') as f:
+            config = json.load(f)
+    except FileNotFoundError as e:
+        print(f"Error ao abrir o arquivo de configuração: {e}")
+        raise
+
+    validate_config(config)
+    mark('config')
+
+    spec = importlib.util.spec_from_file_location("rosie", os.path.join(DOWNLOAD_DIR, 'rosie.py'))
+    rosie_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(rosie_module)
+    mark('rosie_module')
+
+    return rosie_module, config
+
+def report_startup(rosie_module):
+    """
+    Imprime o tempo de cada etapa do bootstrap (--profile-startup), inclusive quando a
+    execução falha, e o tempo dos imports feitos sob demanda pelo módulo rosie.
+    """
+    print("Tempos de inicialização (s):")
+    for (_, previous), (step, current) in zip(checkpoints, checkpoints[1:]):
+        print(f"  {step}: {current - previous:.3f}")
+    for module, seconds in rosie_module.RosieLazyModule.timings.items():
+        print(f"  import {module} (sob demanda): {seconds:.3f}")
+
+def main(monitors: str = None):
+    """
+    Executa os monitoramentos informados em --MONITORS (ou em `monitors`, nos scripts de
+    cada monitoramento). Ex: GLUE_MONITORING,S3_MONITORING,CLEANER.
+    """
+    args = parse_args()
+    profile_startup = args.profile_startup.lower() == 'true'
+
+    # Ex: --MONITORS GLUE_MONITORING,S3_MONITORING,CLEANER
+    monitors = [monitor.strip().upper() for monitor in (monitors or args.MONITORS).split(',') if monitor.strip()]
+    services = {monitor.replace('_MONITORING', ''): {} for monitor in monitors if monitor != 'CLEANER'}
+
+    session = boto3.Session()
+    mark('session')
+
+    bucket = get_bucket(session, args.ROSIE_BUCKET, args.ROSIE_CONFIG)
+    mark('bucket')
+
+    rosie_module, config = load_rosie(session, bucket)
+
+    print(f"Monitoramentos selecionados: {monitors}")
+
+    try:
+        rosie = rosie_module.Rosie(config=config, session=session)
+
+        if 'CLEANER' in monitors and services:
+            rosie.monitor_and_clean(services)
+        elif 'CLEANER' in monitors:
+            # --PARTITION_DATE YYYY-MM-DD retoma a limpeza de uma partição de outro dia
+            cleaner = rosie_module.RosieCleaner(config=config, client_factory=rosie.client_factory, partition_date=args.PARTITION_DATE)
+            cleaner.clean(services=['GLUE', 'S3', 'STEP_FUNCTIONS', 'DATA_CATALOG'])
+        else:
+            rosie.run_monitors(services)
+
+        rosie.save_metrics()
+    finally:
+        mark('run')
+        if profile_startup:
+            report_startup(rosie_module)
+
+if __name__ == '__main__':
+    main()
@@ -46,6 +46,7 @@ class RosieInstaller:
         self.enable_backup = False
         self.backup_retention = None
         self.enable_rosie_cleaner = False
+        self.partition_projection = False
 
     def install(self):
         self.clear()
@@ -61,6 +62,7 @@ class RosieInstaller:
         self.configure_rosie_cleaner()
         if self.enable_rosie_cleaner:
             self.configure_backup()
+        self.configure_partition_projection()
         legacy = self.check_legacy(self.date)
         self.cron_expression = self.get_trigger_info()
         self.generate_config_file(legacy)
@@ -146,6 +148,12 @@ class RosieInstaller:
             f"Deseja habilitar o ROSIE CLEANER para limpeza dos recursos monitorados pela ROSIE? {YELLOW_START}(y/n){END} "
             )
 
+    def configure_partition_projection(self):
+
+        self.partition_projection = validate_bool_input(
+            f"\nDeseja habilitar o partition projection do Athena na tabela de controle da ROSIE? {YELLOW_START}(y/n){END} "
+            )
+
     def generate_config_file(self, legacy):
         config_path = os.path.join(os.path.dirname(__file__), "../../app/config.json")
         with open(config_path, "w") as file:
@@ -162,6 +170,19 @@ class RosieInstaller:
                             "CRON_EXPRESSION": self.cron_expression,
                             "BUCKET_NAME": f"itau-self-wkp-{self.account_info['AWS_REGION']}-{self.account_info['AWS_ACCOUNT_ID']}",
                             "ENABLE_ROSIE_CLEANER": self.enable_rosie_cleaner,
+                            "MAX_WORKERS": 10,
+                            "SHARED_RUNTIME": False,
+                            "AWS_MAX_ATTEMPTS": 10,
+                            "AWS_RETRY_MODE": "adaptive",
+                            "API_RATE_LIMITS": {
+                                "glue.GetJobRuns": 10,
+                                "glue.GetTags": 10,
+                                "stepfunctions.ListExecutions": 10,
+                                "s3.ListObjectsV2": 50,
+                            },
+                            "API_METRICS": True,
+                            "CLEANER_PURGE_VERSIONS": False,
+                            "PARTITION_PROJECTION": self.partition_projection,
                             "BACKUP": {
                                 "ENABLE_BACKUP": self.enable_backup,
                                 "BACKUP_RETENTION": self.backup_retention,
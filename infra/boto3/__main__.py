@@ -22,6 +22,13 @@ if __name__ == "__main__":
     ROLE_ARN = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['ROLE_ARN']
     MONITORING = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['MONITORING']
     BUCKET = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['BUCKET_NAME']
+    PARTITION_PROJECTION = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME'].get('PARTITION_PROJECTION', False)
+    SHARED_RUNTIME = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME'].get('SHARED_RUNTIME', False)
+    # Os scripts de cada monitoramento importam o bootstrap único de rosie_runtime.py
+    JOB_ARGUMENTS = {
+        '--ROSIE_BUCKET': BUCKET,
+        '--extra-py-files': f"s3://{BUCKET}/ROSIE/scripts/rosie_runtime.py"
+    }
     
     # s3.create_bucket(
     #     aws_account_id=AWS_ACCOUNT_ID,
@@ -38,14 +45,15 @@ if __name__ == "__main__":
         AWS_SECRET_ACCESS_KEY=AWS_SECRET_ACCESS_KEY)
 
     for monitor in MONITORING:
-        if config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['MONITORING'][monitor]['ENABLE_VALIDATION']:
+        if config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['MONITORING'][monitor]['ENABLE_VALIDATION'] and not SHARED_RUNTIME:
             glue.create(
                 glue_job_name=f"rosie-{monitor.lower()}",
                 role_arn=ROLE_ARN,
                 script_location=f"s3://{BUCKET}/ROSIE/scripts/{monitor.lower()}.py",
                 region=AWS_REGION,
                 AWS_ACCESS_KEY_ID=AWS_ACCESS_KEY_ID,
-                AWS_SECRET_ACCESS_KEY=AWS_SECRET_ACCESS_KEY
+                AWS_SECRET_ACCESS_KEY=AWS_SECRET_ACCESS_KEY,
+                default_arguments=JOB_ARGUMENTS
             )
         else:
             glue.delete(
@@ -55,14 +63,15 @@ if __name__ == "__main__":
                 AWS_SECRET_ACCESS_KEY=AWS_SECRET_ACCESS_KEY
             )
     
-    if config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['ENABLE_ROSIE_CLEANER']:
+    if config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['ENABLE_ROSIE_CLEANER'] and not SHARED_RUNTIME:
         glue.create(
             glue_job_name="rosie-cleaner_monitoring",
             role_arn=ROLE_ARN,
             script_location=f"s3://{BUCKET}/ROSIE/scripts/rosie_cleaner_monitoring.py",
             region=AWS_REGION,
             AWS_ACCESS_KEY_ID=AWS_ACCESS_KEY_ID,
-            AWS_SECRET_ACCESS_KEY=AWS_SECRET_ACCESS_KEY
+            AWS_SECRET_ACCESS_KEY=AWS_SECRET_ACCESS_KEY,
+            default_arguments=JOB_ARGUMENTS
         )
     else:
         glue.delete(
@@ -72,10 +81,33 @@ if __name__ == "__main__":
             AWS_SECRET_ACCESS_KEY=AWS_SECRET_ACCESS_KEY
         )
 
+    if SHARED_RUNTIME:
+        monitors = [monitor for monitor in MONITORING if MONITORING[monitor]['ENABLE_VALIDATION']]
+        if config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['ENABLE_ROSIE_CLEANER']:
+            monitors.append('CLEANER')
+
+        glue.create(
+            glue_job_name="rosie-runtime",
+            role_arn=ROLE_ARN,
+            script_location=f"s3://{BUCKET}/ROSIE/scripts/rosie_runtime.py",
+            region=AWS_REGION,
+            AWS_ACCESS_KEY_ID=AWS_ACCESS_KEY_ID,
+            AWS_SECRET_ACCESS_KEY=AWS_SECRET_ACCESS_KEY,
+            default_arguments={'--MONITORS': ','.join(monitors), '--ROSIE_BUCKET': BUCKET}
+        )
+    else:
+        glue.delete(
+            glue_job_name="rosie-runtime",
+            region=AWS_REGION,
+            AWS_ACCESS_KEY_ID=AWS_ACCESS_KEY_ID,
+            AWS_SECRET_ACCESS_KEY=AWS_SECRET_ACCESS_KEY
+        )
+
     table.create(
         bucket=BUCKET,
         table_name=TABLE,
         database_name=DATABASE,
+        partition_projection=PARTITION_PROJECTION,
         region=AWS_REGION,
         AWS_ACCESS_KEY_ID=AWS_ACCESS_KEY_ID,
         AWS_SECRET_ACCESS_KEY=AWS_SECRET_ACCESS_KEY
@@ -10,7 +10,8 @@ def create(
         script_location: str, 
         region: str,
         AWS_ACCESS_KEY_ID: str, 
-        AWS_SECRET_ACCESS_KEY: str
+        AWS_SECRET_ACCESS_KEY: str,
+        default_arguments: dict = None
     ):
     
     glue_client = boto3.client('glue', region_name=region, aws_access_key_id=AWS_ACCESS_KEY_ID, aws_secret_access_key=AWS_SECRET_ACCESS_KEY)
@@ -37,6 +38,7 @@ def create(
                 'ScriptLocation': script_location,
                 'PythonVersion': '3.9'
             },
+            DefaultArguments=default_arguments or {},
             # Connections={
             #     'Connections': [
             #         'analytics-glue-connection-aza',
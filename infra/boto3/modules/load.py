@@ -17,6 +17,7 @@ def scripts(
         s3 = boto3.client('s3', region_name=region, aws_access_key_id=AWS_ACCESS_KEY_ID, aws_secret_access_key=AWS_SECRET_ACCESS_KEY)
         s3.upload_file(Filename=f'{os.path.join(os.path.dirname(__file__), "../../../app/config.json")}', Bucket=bucket_name, Key='ROSIE/src/config.json')
         s3.upload_file(Filename=f'{os.path.join(os.path.dirname(__file__), "../../../app/rosie.py")}', Bucket=bucket_name, Key='ROSIE/src/rosie.py')
+        s3.upload_file(Filename=f'{os.path.join(os.path.dirname(__file__), "../../../app/table/rosie-control_table.json")}', Bucket=bucket_name, Key='ROSIE/src/rosie-control_table.json')
 
         scripts_path = os.path.join(os.path.dirname(__file__), "../../../app/scripts/")
         for script in os.listdir(scripts_path):
@@ -19,9 +19,22 @@ def create(
     sfn_client = boto3.client('stepfunctions', region_name=region, aws_access_key_id=AWS_ACCESS_KEY_ID, aws_secret_access_key=AWS_SECRET_ACCESS_KEY)
 
     MONITORING = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['MONITORING']
+    SHARED_RUNTIME = config['ROSIE_INFOS']['INSTALLATION']['RUNTIME'].get('SHARED_RUNTIME', False)
     branchs = []
+    if SHARED_RUNTIME:
+        branchs.append({
+            'StartAt': 'Rosie Runtime',
+            'States': {
+                'Rosie Runtime': {
+                    'Type': 'Task',
+                    'Resource': f'arn:aws:states:::glue:startJobRun',
+                    'Arguments': {'JobName': 'rosie-runtime'},
+                    'End': True
+                }
+            }
+        })
     for monitor in MONITORING:
-        if config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['MONITORING'][monitor]['ENABLE_VALIDATION']:
+        if config['ROSIE_INFOS']['INSTALLATION']['RUNTIME']['MONITORING'][monitor]['ENABLE_VALIDATION'] and not SHARED_RUNTIME:
             branchs.append({
                 'StartAt': f'Rosie {monitor.replace("_", " ").title()}',
                 'States': {
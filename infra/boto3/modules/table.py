@@ -9,6 +9,7 @@ def create(
         bucket: str,
         table_name: str, 
         database_name: str,
+        partition_projection: bool,
         region: str,
         AWS_ACCESS_KEY_ID: str,
         AWS_SECRET_ACCESS_KEY: str
@@ -19,6 +20,27 @@ def create(
 
     with open(os.path.join(os.path.dirname(__file__), "../../../app/table/partitions.json"), 'r') as f:
         partitions = json.load(f)
+
+    parameters = {
+        'classification': 'parquet',
+        'parquet.compression': 'SNAPPY'
+    }
+
+    if partition_projection:
+        parameters.update({
+            'projection.enabled': 'true',
+            'projection.ano_dt_safra.type': 'integer',
+            'projection.ano_dt_safra.range': '2024,2099',
+            'projection.mes_dt_safra.type': 'integer',
+            'projection.mes_dt_safra.range': '1,12',
+            'projection.mes_dt_safra.digits': '2',
+            'projection.dia_dt_safra.type': 'integer',
+            'projection.dia_dt_safra.range': '1,31',
+            'projection.dia_dt_safra.digits': '2',
+            'projection.tipo.type': 'enum',
+            'projection.tipo.values': 'GLUE,STEP_FUNCTIONS,S3,DATA_CATALOG,CLEANER,METRICS',
+            'storage.location.template': f"s3://{bucket}/ROSIE/{table_name}/ano_dt_safra=${{ano_dt_safra}}/mes_dt_safra=${{mes_dt_safra}}/dia_dt_safra=${{dia_dt_safra}}/tipo=${{tipo}}"
+        })
     
     print(f"{YELLOW_START}{BOLD_START}\n⏳ Criando tabela '{table_name}' de gerenciamento da Rosie ...{END}")
     glue_client = boto3.client('glue', region_name=region, aws_access_key_id=AWS_ACCESS_KEY_ID, aws_secret_access_key=AWS_SECRET_ACCESS_KEY)
@@ -48,10 +70,7 @@ def create(
                     },
                     'TableType': 'EXTERNAL_TABLE',
                     'PartitionKeys': partitions,
-                    'Parameters': {
-                        'classification': 'parquet',
-                        'parquet.compression': 'SNAPPY'
-                    }
+                    'Parameters': parameters
                 }
             )
             print(f"{GREEN_START}{BOLD_START}✅ Tabela '{table_name}' de gerenciamento atualizada com sucesso!{END}")
@@ -76,10 +95,7 @@ def create(
                     },
                     'TableType': 'EXTERNAL_TABLE',
                     'PartitionKeys': partitions,
-                    'Parameters': {
-                        'classification': 'parquet',
-                        'parquet.compression': 'SNAPPY'
-                    }
+                    'Parameters': parameters
                 }
             )
             print(f"{GREEN_START}{BOLD_START}✅ Tabela de gerenciamento '{table_name}' criada com sucesso!{END}")
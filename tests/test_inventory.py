@@ -0,0 +1,116 @@
+import gzip
+import json
+from urllib.parse import quote_plus
+
+import boto3
+import pytest
+from moto import mock_aws
+
+import rosie
+
+SOURCE_BUCKET = 'source-bucket'
+INVENTORY_BUCKET = 'inventory-bucket'
+INVENTORY = f's3://{INVENTORY_BUCKET}/inventario/{SOURCE_BUCKET}/diario/'
+KEYS = [
+    'top.txt',
+    'outros/1.csv',
+    'dados/tabela a/1.csv',
+    'dados/tabela a/particao=1/2.csv',
+    'dados/tabela+b/1.csv',
+    'dados/tabela_c.csv',
+    'dados/manter/1.csv',
+    'manter.txt',
+]
+CONFIG = {
+    'ROSIE_INFOS': {
+        'INSTALLATION': {
+            'LEGACY': {'ENABLED': False},
+            'AWS_ACCOUNT': {'AWS_REGION': 'us-east-1', 'AWS_ACCOUNT_ID': '123456789012'},
+            'RUNTIME': {
+                'BUCKET_NAME': 'rosie-bucket',
+                'DATABASE_NAME': 'workspace_db',
+                'TABLE_NAME': 'rosie-control_table',
+                'PARTITION_PROJECTION': True,
+                'MONITORING': {
+                    'S3_MONITORING': {
+                        'LIFECYCLE': {'TYPE_OF_MANAGEMENT': 'UNIQUE', 'RETENTION_DAYS': 30, 'DELETION_ALERT_COMING_DAYS': 5}
+                    }
+                },
+                'BACKUP': {'ENABLE_BACKUP': False},
+            },
+        }
+    }
+}
+BUCKETS = [{
+    'bucket': SOURCE_BUCKET,
+    'prefixes': ['', 'dados/'],
+    'objectNotDelete': ['manter.txt', 'dados/manter/'],
+    'inventory': INVENTORY,
+}]
+
+
+def write_inventory(s3):
+    """
+    Gera um relatório CSV do S3 Inventory a partir dos objetos do bucket de origem, com as
+    chaves codificadas como no relatório real (URL encoding, espaço como '+') e divididas
+    em dois arquivos fora de ordem.
+    """
+    objects = s3.list_objects_v2(Bucket=SOURCE_BUCKET)['Contents']
+    lines = [
+        f'"{SOURCE_BUCKET}","{quote_plus(obj["Key"], safe="/")}","{obj["Size"]}","{obj["LastModified"].strftime("%Y-%m-%dT%H:%M:%S.000Z")}"'
+        for obj in reversed(objects)
+    ]
+
+    files = []
+    for index, chunk in enumerate([lines[:len(lines) // 2], lines[len(lines) // 2:]]):
+        key = f'inventario/{SOURCE_BUCKET}/diario/data/{index}.csv.gz'
+        s3.put_object(Bucket=INVENTORY_BUCKET, Key=key, Body=gzip.compress('\n'.join(chunk).encode('utf-8')))
+        files.append({'key': key})
+
+    s3.put_object(
+        Bucket=INVENTORY_BUCKET,
+        Key=f'inventario/{SOURCE_BUCKET}/diario/2026-01-01T01-00Z/manifest.json',
+        Body=json.dumps({'fileFormat': 'CSV', 'fileSchema': 'Bucket, Key, Size, LastModifiedDate', 'files': files})
+    )
+
+
+@pytest.fixture
+def aws():
+    with mock_aws():
+        s3 = boto3.client('s3')
+        for bucket in [SOURCE_BUCKET, INVENTORY_BUCKET, 'rosie-bucket']:
+            s3.create_bucket(Bucket=bucket)
+        for size, key in enumerate(KEYS, start=1):
+            s3.put_object(Bucket=SOURCE_BUCKET, Key=key, Body=b'x' * size * 100)
+        write_inventory(s3)
+        yield s3
+
+
+def test_inventory_matches_api_listing(aws):
+    monitor = rosie.Rosie(CONFIG, max_workers=1)
+
+    from_api = monitor.monitor_s3(buckets=BUCKETS, source='API', collect=True)
+    from_inventory = monitor.monitor_s3(buckets=BUCKETS, source='INVENTORY', collect=True)
+
+    def by_name(rows):
+        return {row['nome_recurso']: row for row in rows}
+
+    assert by_name(from_inventory) == by_name(from_api)
+    assert set(by_name(from_inventory)) == {
+        f's3://{SOURCE_BUCKET}/top.txt',
+        f's3://{SOURCE_BUCKET}/outros/',
+        f's3://{SOURCE_BUCKET}/dados/tabela a/',
+        f's3://{SOURCE_BUCKET}/dados/tabela+b/',
+        f's3://{SOURCE_BUCKET}/dados/tabela_c.csv',
+    }
+
+
+def test_inventory_decodes_keys(aws):
+    inventory = rosie.RosieInventory()
+
+    entries = inventory.aggregate_prefixes(aws, INVENTORY, ['dados/'])['dados/']
+
+    stats = {obj: (type_of_object, obj_stats['object_count']) for type_of_object, obj, obj_stats in entries}
+    assert stats['dados/tabela a/'] == ('folder', 2)
+    assert stats['dados/tabela+b/'] == ('folder', 1)
+    assert stats['dados/tabela_c.csv'] == ('file', 1)
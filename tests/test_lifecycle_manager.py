@@ -0,0 +1,80 @@
+import boto3
+import pytest
+from moto import mock_aws
+
+import rosie
+
+BUCKET = 'rosie-bucket'
+LIFECYCLE = {
+    'LIFECYCLE': {
+        'TYPE_OF_MANAGEMENT': 'TAG',
+        'DETAILS': {
+            'TAG_NAME': 'retencao',
+            'ALLOWED_VALUES': [
+                {'VALUE': 'curto', 'RETENTION': True, 'RETENTION_DAYS': 30, 'DELETION_ALERT_COMING_DAYS': 5, 'CHECK_IDLE': False, 'IDLE_DAYS': None},
+            ],
+            'IRREGULAR_FORMAT': {'QUARANTINE': True, 'QUARANTINE_DAYS': 7},
+        },
+    }
+}
+CONFIG = {
+    'ROSIE_INFOS': {
+        'INSTALLATION': {
+            'LEGACY': {'ENABLED': False},
+            'AWS_ACCOUNT': {'AWS_REGION': 'us-east-1', 'AWS_ACCOUNT_ID': '123456789012'},
+            'RUNTIME': {
+                'BUCKET_NAME': BUCKET,
+                'DATABASE_NAME': 'workspace_db',
+                'TABLE_NAME': 'rosie-control_table',
+                'PARTITION_PROJECTION': True,
+                'MONITORING': {'GLUE_MONITORING': LIFECYCLE},
+                'BACKUP': {'ENABLE_BACKUP': False},
+            },
+        }
+    }
+}
+
+
+@pytest.fixture
+def aws():
+    with mock_aws():
+        boto3.client('s3').create_bucket(Bucket=BUCKET)
+        glue = boto3.client('glue')
+        glue.create_job(Name='job-tagged', Role='role', Command={'Name': 'pythonshell', 'ScriptLocation': 's3://scripts/a.py'}, Tags={'retencao': 'curto'})
+        glue.create_job(Name='job-untagged', Role='role', Command={'Name': 'pythonshell', 'ScriptLocation': 's3://scripts/b.py'})
+        yield
+
+
+def count_calls(client, event: str) -> list:
+    calls = []
+    client.meta.events.register(f'before-call.{event}', lambda **kwargs: calls.append(kwargs['model'].name))
+    return calls
+
+
+def test_prefetch_avoids_per_resource_get_tags(aws):
+    monitor = rosie.Rosie(CONFIG, max_workers=1)
+    get_tags = count_calls(monitor.client('glue'), 'glue.GetTags')
+
+    verify = monitor.monitor_glue(collect=True)
+
+    assert get_tags == []
+    assert monitor.lifecycle_manager.prefetched_tags == {'GLUE_MONITORING'}
+    classes = {row['nome_recurso']: row['classe_recurso'] for row in verify}
+    assert classes == {'job-tagged': 'CURTO', 'job-untagged': 'N/A'}
+
+
+def test_failed_prefetch_falls_back_to_get_tags(aws, capsys):
+    monitor = rosie.Rosie(CONFIG, max_workers=1)
+    tagging = monitor.client_factory.client('resourcegroupstaggingapi')
+
+    def unavailable(**kwargs):
+        raise RuntimeError('Tagging API indisponível')
+
+    tagging.meta.events.register('before-call.resource-groups-tagging-api.GetResources', unavailable)
+    get_tags = count_calls(monitor.client('glue'), 'glue.GetTags')
+
+    monitor.monitor_glue(collect=True)
+
+    assert len(get_tags) == 2
+    assert monitor.lifecycle_manager.prefetched_tags == set()
+    assert 'Tags carregadas em lote' not in capsys.readouterr().out